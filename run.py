@@ -17,10 +17,24 @@ import asset_nav_panel.icon
 import asset_nav_panel.utils
 import asset_nav_panel.analyze_panel
 import asset_nav_panel.analysis
+import asset_nav_panel.hashing
+import asset_nav_panel.render_server
+import asset_nav_panel.rollups
+import asset_nav_panel.sniff
+import asset_nav_panel.softrender
+import asset_nav_panel.prefetch
+import asset_nav_panel.importer
 
 
+importlib.reload(asset_nav_panel.sniff)
+importlib.reload(asset_nav_panel.hashing)
+importlib.reload(asset_nav_panel.render_server)
+importlib.reload(asset_nav_panel.rollups)
+importlib.reload(asset_nav_panel.softrender)
+importlib.reload(asset_nav_panel.prefetch)
 importlib.reload(asset_nav_panel.icon)
 importlib.reload(asset_nav_panel.thumbnails)
+importlib.reload(asset_nav_panel.importer)
 importlib.reload(asset_nav_panel.utils)
 importlib.reload(asset_nav_panel.panel)
 importlib.reload(asset_nav_panel)
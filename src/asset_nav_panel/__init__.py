@@ -3,9 +3,21 @@ Asset Nav Panel
 Maya folder navigator with thumbnail support.
 """
 
-from .panel import show, FolderNavWidget
-
 __all__ = [
     "show",
     "FolderNavWidget",
 ]
+
+
+def show():
+    from .panel import show as _show
+    return _show()
+
+
+def __getattr__(name):
+    # The panel needs Maya and Qt; importing it lazily keeps the pure
+    # Python modules (hashing, sniff, softrender...) usable without Maya
+    if name == "FolderNavWidget":
+        from .panel import FolderNavWidget
+        return FolderNavWidget
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
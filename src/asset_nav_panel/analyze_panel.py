@@ -3,115 +3,445 @@ try:
 except Exception:
     from PySide2 import QtWidgets, QtCore
 
-from .analysis import analyze_model
 import os
+import csv
+import json
+
+# Table columns, numeric ones can be sorted and filtered by range
+COLUMNS = ["File", "Mesh", "Verts", "Polys", "Ngons", "UV sets", "Errors", "Identical to"]
+NUMERIC_COLUMNS = [2, 3, 4]
+
+
+def report_rows(report, path=None, same_as=None):
+    """
+    Flatten an analysis report into table rows, one per mesh.
+    File level errors get their own row without mesh statistics.
+
+    :param same_as: file whose report was reused because its content is
+        identical, shown in the "Identical to" column
+    """
+    path = path or report["model"]
+    same_as = same_as or ""
+    rows = []
+    for m in report["meshes"]:
+        rows.append([
+            path,
+            m["mesh"],
+            m["vertices"],
+            m["polygons"],
+            m["ngons"],
+            ", ".join(m["uv_sets"]),
+            "",
+            same_as,
+        ])
+    if report["errors"]:
+        rows.append([path, "", None, None, None, "", "; ".join(report["errors"]), same_as])
+    return rows
+
+
+class AnalysisTableModel(QtCore.QAbstractTableModel):
+    """
+    Flat table of mesh statistics that grows while the analysis runs.
+    Rows are plain lists so 100k meshes stay cheap to hold and sort:
+    sort() orders them with list.sort on the raw values instead of
+    comparing through data().
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.AscendingOrder
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._rows[index.row()][index.column()]
+
+        if role == QtCore.Qt.DisplayRole:
+            return "" if value is None else value
+        if role == QtCore.Qt.TextAlignmentRole and index.column() in NUMERIC_COLUMNS:
+            return QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0 or not self._rows:
+            return
+
+        # Rows without stats sort first
+        if column in NUMERIC_COLUMNS:
+            def key(i):
+                value = self._rows[i][column]
+                return -1 if value is None else value
+        else:
+            def key(i):
+                return self._rows[i][column] or ""
+
+        self.layoutAboutToBeChanged.emit()
+        order_ids = sorted(range(len(self._rows)), key=key, reverse=(order == QtCore.Qt.DescendingOrder))
+        self._rows = [self._rows[i] for i in order_ids]
+
+        # Keep selections and other persistent indexes on their rows
+        position = [0] * len(order_ids)
+        for new, old in enumerate(order_ids):
+            position[old] = new
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent, [self.index(position[i.row()], i.column()) for i in persistent])
+        self.layoutChanged.emit()
+
+    def resort(self):
+        """
+        Apply the last sort again, e.g. after rows were appended.
+        """
+        self.sort(self._sort_column, self._sort_order)
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+    def row(self, row):
+        return self._rows[row]
+
+
+class AnalysisFilterProxy(QtCore.QSortFilterProxyModel):
+    """
+    Filters by text (file / mesh) plus an optional min/max range on one
+    numeric column. Rows without statistics are hidden only while a
+    bound is set. Sorting is passed to the source model, the proxy keeps
+    the source order.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = ""
+        self._range_column = None
+        self._minimum = None
+        self._maximum = None
+
+    def set_text_filter(self, text):
+        self._text = text.lower()
+        self.invalidateFilter()
+
+    def set_range_filter(self, column, minimum=None, maximum=None):
+        self._range_column = column
+        self._minimum = minimum
+        self._maximum = maximum
+        self.invalidateFilter()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        row = self.sourceModel().row(source_row)
+
+        if self._text and self._text not in row[0].lower() and self._text not in row[1].lower():
+            return False
+
+        if self._range_column is not None and (self._minimum is not None or self._maximum is not None):
+            value = row[self._range_column]
+            if value is None:
+                return False
+            if self._minimum is not None and value < self._minimum:
+                return False
+            if self._maximum is not None and value > self._maximum:
+                return False
+        return True
+
+    def visible_rows(self):
+        source = self.sourceModel()
+        return [source.row(self.mapToSource(self.index(r, 0)).row()) for r in range(self.rowCount())]
+
 
 class AnalyzeDialog(QtWidgets.QDialog):
     """
     Dialog that runs asset analysis on a list of file paths
-    and displays the results in a read-only text view.
+    and streams the results into a sortable, filterable table.
+
+    With a render_client the files are analyzed by the render server
+    instead of this session; result_signal must deliver the client's
+    result messages on the GUI thread.
     """
 
-    def __init__(self, file_paths, parent=None):
+    def __init__(self, file_paths, parent=None, hash_index=None, on_report=None,
+                 render_client=None, result_signal=None):
         super().__init__(parent)
 
+        # Optional ContentHashIndex, identical files are analyzed once
+        self.hash_index = hash_index
+        # Optional callable(path, report) run as each file completes
+        self.on_report = on_report
+        self.render_client = render_client
+        self.result_signal = result_signal
+        self._canceled = False
+        self._total = 0
+        self._done = 0
+        self._meshes = 0
+        # Server mode: files waiting for a free slot, and job id -> paths
+        self._backlog = []
+        self._jobs = {}
+
         # Window setup
         self.setWindowTitle("Asset Analysis")
-        self.resize(720, 480)
+        self.resize(900, 520)
 
         layout = QtWidgets.QVBoxLayout(self)
 
-        # Read-only output area for analysis results
-        self.text = QtWidgets.QPlainTextEdit()
-        self.text.setReadOnly(True)
-        layout.addWidget(self.text)
+        # Filter row: text filter + numeric range on one column
+        filter_row = QtWidgets.QHBoxLayout()
+        self.filter_edit = QtWidgets.QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter by file or mesh...")
+        filter_row.addWidget(self.filter_edit)
+
+        self.range_combo = QtWidgets.QComboBox()
+        self.range_combo.addItem("No range", None)
+        for column in NUMERIC_COLUMNS:
+            self.range_combo.addItem(COLUMNS[column], column)
+        filter_row.addWidget(self.range_combo)
+
+        self.min_spin = QtWidgets.QSpinBox()
+        self.max_spin = QtWidgets.QSpinBox()
+        for spin, label in ((self.min_spin, "min"), (self.max_spin, "max")):
+            # -1 shows "min"/"max" and means no bound, so 0 is a real bound
+            spin.setRange(-1, 2 ** 31 - 1)
+            spin.setSpecialValueText(label)
+            spin.setValue(-1)
+            filter_row.addWidget(spin)
+        layout.addLayout(filter_row)
+
+        # Results table
+        self.model = AnalysisTableModel(self)
+        self.proxy = AnalysisFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setSortingEnabled(True)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        # Fixed row height keeps scrolling cheap with very large tables
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(20)
+        self.table.verticalHeader().hide()
+        layout.addWidget(self.table)
 
-        # Close button
+        # Progress row
+        progress_row = QtWidgets.QHBoxLayout()
+        self.progress = QtWidgets.QProgressBar()
+        self.cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.summary = QtWidgets.QLabel("")
+        progress_row.addWidget(self.progress)
+        progress_row.addWidget(self.cancel_btn)
+        progress_row.addWidget(self.summary)
+        layout.addLayout(progress_row)
+
+        # Export + close buttons
         btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Close)
+        self.csv_btn = btns.addButton("Export CSV", QtWidgets.QDialogButtonBox.ActionRole)
+        self.json_btn = btns.addButton("Export JSON", QtWidgets.QDialogButtonBox.ActionRole)
         btns.rejected.connect(self.close)
         layout.addWidget(btns)
 
-        # Start analysis immediately after dialog creation
-        self.run_analysis(file_paths)
+        self.filter_edit.textChanged.connect(self.proxy.set_text_filter)
+        self.range_combo.currentIndexChanged.connect(self._update_range_filter)
+        self.min_spin.valueChanged.connect(self._update_range_filter)
+        self.max_spin.valueChanged.connect(self._update_range_filter)
+        self.cancel_btn.clicked.connect(self._on_cancel)
+        self.csv_btn.clicked.connect(self.export_csv)
+        self.json_btn.clicked.connect(self.export_json)
+
+        # Start once the dialog is visible so rows stream in as they arrive
+        if self.render_client is not None:
+            self.result_signal.connect(self.on_server_result)
+            QtCore.QTimer.singleShot(0, lambda: self.run_on_server(file_paths))
+        else:
+            QtCore.QTimer.singleShot(0, lambda: self.run_analysis(file_paths))
+
+    def _update_range_filter(self, *args):
+        column = self.range_combo.currentData()
+        minimum = self.min_spin.value() if self.min_spin.value() >= 0 else None
+        maximum = self.max_spin.value() if self.max_spin.value() >= 0 else None
+        self.proxy.set_range_filter(column, minimum, maximum)
+
+    def _on_cancel(self):
+        self._canceled = True
+        self._backlog = []
+        if self.render_client is not None:
+            self.summary.setText("Analysis canceled by user.")
+            self.cancel_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        self._on_cancel()
+        if self.render_client is not None:
+            try:
+                self.result_signal.disconnect(self.on_server_result)
+            except (RuntimeError, TypeError):
+                pass
+        super().closeEvent(event)
+
+    def _add_report(self, path, report, same_as=None):
+        if self.on_report:
+            self.on_report(path, report)
+        self.model.append_rows(report_rows(report, path, same_as))
+        self._done += 1
+        self._meshes += len(report["meshes"])
+        self.progress.setValue(self._done)
+        self.summary.setText("{} / {} files, {} meshes".format(self._done, self._total, self._meshes))
 
     def run_analysis(self, paths):
         """
         Executes analysis for each file path.
-        Displays a cancelable progress dialog and aggregates results.
+        Rows for each file are added to the table as soon as it completes.
         """
-        
-        output = []
-        total = len(paths)
+        paths = [p for p in paths if os.path.isfile(p)]
+        reports_by_key = {}
+        self._total = len(paths)
 
          # Nothing to analyze
-        if total == 0:
+        if not paths:
             return
 
-        # Progress dialog for user feedback and cancel support
-        progress = QtWidgets.QProgressDialog(
-            "Analyzing assets...",
-            "Cancel",
-            0,
-            total,
-            self
-        )
-        progress.setWindowTitle("Analysis")
-        progress.setWindowModality(QtCore.Qt.WindowModal)
-        progress.setMinimumDuration(0)  # show immediately
-        progress.setValue(0)
-
-        for i, path in enumerate(paths):
+        from .analysis import analyze_model
+
+        self.progress.setRange(0, self._total)
+        self.progress.setValue(0)
+
+        for path in paths:
             # Keep UI responsive
             QtWidgets.QApplication.processEvents()
-            
+
             # Allow user to cancel analysis
-            if progress.wasCanceled():
-                output.append("Analysis canceled by user.")
+            if self._canceled:
+                self.summary.setText("Analysis canceled by user.")
                 break
 
-            progress.setValue(i)
-
-            # Skip invalid paths
-            if not os.path.isfile(path):
-                continue
-
-            # Run model analysis (external logic)
-            report = analyze_model(path)
-
-            output.append("Model: {}".format(path))
-
-            # Append per-mesh statistics
-            for m in report["meshes"]:
-                output.append(
-                    "  Mesh: {}\n"
-                    "    Verts: {} | "
-                    "Polys: {} | "
-                    "Ngons: {} | "
-                    "UV sets: {}".format(
-                        m["mesh"],
-                        m["vertices"],
-                        m["polygons"],
-                        m["ngons"],
-                        m["uv_sets"]
-                    )
-                )
-            # Append reported errors
-            for err in report["errors"]:
-                output.append("  ERROR: {}".format(err))
-
-            output.append("")
-        # Finalize progress UI
-        progress.setValue(total)
-        progress.close()
-
-        # Display formatted output in dialog
-        self.text.setPlainText("\n".join(output))
-
-
-def show_analyze_panel(file_paths, parent=None):
+            # Run model analysis (external logic), reusing the report
+            # of an identical file when deduplicating by content
+            key = self.hash_index.key_for(path) if self.hash_index else None
+            if key in reports_by_key:
+                report, same_as = reports_by_key[key]
+            else:
+                report, same_as = analyze_model(path), None
+                if key:
+                    reports_by_key[key] = (report, path)
+
+            self._add_report(path, report, same_as)
+
+        self._finish()
+
+    def run_on_server(self, paths):
+        """
+        Queue one analyze job per distinct file on the render server.
+        Rows are added by on_server_result as the results stream back.
+        """
+        paths = [p for p in paths if os.path.isfile(p)]
+        self._total = len(paths)
+        if not paths:
+            self.cancel_btn.setEnabled(False)
+            return
+        self.progress.setRange(0, self._total)
+        self.progress.setValue(0)
+
+        # Identical files share one job when deduplicating by content
+        groups = {}
+        for path in paths:
+            key = self.hash_index.key_for(path) if self.hash_index else path
+            groups.setdefault(key, []).append(path)
+        self._backlog = list(groups.values())
+        self._feed_server()
+
+    def _feed_server(self):
+        # Submit only while the client has free slots, never block the GUI
+        while self._backlog:
+            group = self._backlog[0]
+            try:
+                job_id = self.render_client.submit("analyze", group[0], timeout=0)
+            except TimeoutError:
+                return
+            except (ConnectionError, ValueError) as e:
+                # Server gone or not running analyze jobs: fail what is left
+                backlog, self._backlog = self._backlog, []
+                for group in backlog:
+                    self._add_group({"model": group[0], "meshes": [], "errors": [str(e)]}, group)
+                self._finish()
+                return
+            self._jobs[job_id] = group
+            self._backlog.pop(0)
+
+    def on_server_result(self, msg):
+        """
+        Slot for the render client's result messages; others' jobs are ignored.
+        """
+        group = self._jobs.pop(msg.get("id"), None)
+        if group is None:
+            return
+        if not self._canceled:
+            if msg["type"] == "error":
+                report = {"model": group[0], "meshes": [], "errors": [msg["error"]]}
+            else:
+                report = msg["data"]
+            self._add_group(report, group)
+            self._feed_server()
+        if not self._jobs and not self._backlog:
+            self._finish()
+
+    def _add_group(self, report, group):
+        # Later files of a group reused the first one's report
+        for path in group:
+            self._add_report(path, report, group[0] if path != group[0] else None)
+
+    def _finish(self):
+        self.cancel_btn.setEnabled(False)
+        # Rows streamed in after a header click are appended unsorted
+        self.model.resort()
+
+    def export_csv(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export CSV", "analysis.csv", "CSV (*.csv)")
+        if not path:
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            writer.writerows(self.proxy.visible_rows())
+
+    def export_json(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export JSON", "analysis.json", "JSON (*.json)")
+        if not path:
+            return
+        keys = [c.lower().replace(" ", "_") for c in COLUMNS]
+        with open(path, "w") as f:
+            json.dump([dict(zip(keys, row)) for row in self.proxy.visible_rows()], f, indent=4)
+
+
+def show_analyze_panel(file_paths, parent=None, hash_index=None, on_report=None,
+                       render_client=None, result_signal=None):
     """
     Convenience function to display the analysis dialog.
     Blocks execution until the dialog is closed.
     """
-    dlg = AnalyzeDialog(file_paths, parent)
+    dlg = AnalyzeDialog(file_paths, parent, hash_index=hash_index, on_report=on_report,
+                        render_client=render_client, result_signal=result_signal)
     dlg.exec()
@@ -0,0 +1,264 @@
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Bytes read from the head, middle and tail of a file for the sampled hash
+SAMPLE_SIZE = 64 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+
+def stat_key(path):
+    """
+    Identity of a file on disk used to memoize hashes.
+    Any edit changes the size or mtime, a replaced file changes the inode.
+    """
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def sampled_hash(path, sample_size=SAMPLE_SIZE):
+    """
+    Fast hash of the file size plus three samples (head, middle, tail).
+    Files smaller than three samples are hashed completely, so for them
+    the sampled hash is exact.
+    """
+    size = os.path.getsize(path)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(size).encode("ascii"))
+
+    with open(path, "rb") as f:
+        if size <= sample_size * 3:
+            h.update(f.read())
+        else:
+            for offset in (0, size // 2, size - sample_size):
+                f.seek(offset)
+                h.update(f.read(sample_size))
+
+    return h.hexdigest()
+
+
+def full_hash(path, chunk_size=CHUNK_SIZE):
+    """
+    Hash of the complete file content, read in chunks.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def content_thumbnail_name(key):
+    return "content_" + key
+
+
+class ContentHashIndex(object):
+    """
+    Maps files to a content key so byte-identical copies in different
+    folders share one thumbnail and one analysis report.
+
+    A file is first keyed by its sampled hash. Only when another file with
+    the same sampled hash is already known are both fully hashed; equal
+    content shares the existing key, different content gets a new key.
+    Results are memoized by (size, mtime, inode) and can be persisted
+    next to the thumbnails so keys stay stable between sessions. A file
+    edited in place loses its old entry, and a sampled-only key left
+    without content is never reused for different bytes.
+
+    Parameters:
+        index_path (str): Optional json file used by load() / save().
+        max_workers (int): Threads used by submit().
+    """
+    def __init__(self, index_path=None, max_workers=4):
+        self.index_path = index_path
+        self.max_workers = max_workers
+        self._lock = threading.RLock()
+        self._executor = None
+        # stat_key -> {"path", "stat", "sampled", "full", "key"}
+        self._memo = {}
+        # path -> its current memo entry
+        self._by_path = {}
+        # sampled hashes whose sampled-only key belonged to changed content
+        self._retired = set()
+        # sampled hash -> list of memo entries sharing it
+        self._groups = {}
+
+    # Lookup
+    def cached_key(self, path):
+        """
+        Returns the content key if this exact file version is already
+        hashed, otherwise None. Only costs a stat, safe on the GUI thread.
+        """
+        try:
+            entry = self._memo.get(stat_key(path))
+        except OSError:
+            return None
+        return entry["key"] if entry else None
+
+    def key_for(self, path):
+        """
+        Returns the content key of a file, hashing it if needed.
+        """
+        skey = stat_key(path)
+        with self._lock:
+            entry = self._memo.get(skey)
+            if entry:
+                return entry["key"]
+
+        # Hash outside the lock so pool threads can work in parallel
+        sampled = sampled_hash(path)
+        full = None
+
+        while True:
+            with self._lock:
+                entry = self._memo.get(skey)
+                if entry:
+                    return entry["key"]
+
+                # An older version of this file no longer describes its content
+                old = self._by_path.get(path)
+                if old is not None:
+                    self._drop(old)
+
+                # A retired sampled key still names the old content's thumbnail
+                group = self._groups.get(sampled, [])
+                if not group and sampled not in self._retired:
+                    return self._add(skey, path, sampled, None, sampled)
+
+                unconfirmed = [other for other in group if other["full"] is None]
+                if full is not None and not unconfirmed:
+                    for other in group:
+                        if other["full"] == full:
+                            key = other["key"]
+                            break
+                    else:
+                        key = "{}_{}".format(sampled, full)
+                    return self._add(skey, path, sampled, full, key)
+
+            # Full reads of a sampled collision also happen outside the lock,
+            # the group is checked again once they are done
+            if full is None:
+                full = full_hash(path)
+            for other in unconfirmed:
+                self._confirm_full(other)
+
+    def _add(self, skey, path, sampled, full, key):
+        entry = {"path": path, "stat": skey, "sampled": sampled, "full": full, "key": key}
+        self._memo[skey] = entry
+        self._by_path[path] = entry
+        self._groups.setdefault(sampled, []).append(entry)
+        return key
+
+    def _drop(self, entry):
+        if self._memo.get(entry["stat"]) is entry:
+            del self._memo[entry["stat"]]
+        if self._by_path.get(entry["path"]) is entry:
+            del self._by_path[entry["path"]]
+        group = self._groups.get(entry["sampled"], [])
+        if entry in group:
+            group.remove(entry)
+            if not group:
+                del self._groups[entry["sampled"]]
+        # Nobody holds this sampled-only key anymore, never hand it out again
+        if entry["key"] == entry["sampled"] and not any(e["key"] == entry["key"] for e in group):
+            self._retired.add(entry["sampled"])
+
+    def _confirm_full(self, entry):
+        # Lazily compute the full hash of a previously seen file. A file
+        # edited or removed since it was keyed is dropped instead, its
+        # new content must not inherit the old key.
+        try:
+            full = None
+            if stat_key(entry["path"]) == entry["stat"]:
+                full = full_hash(entry["path"])
+                if stat_key(entry["path"]) != entry["stat"]:
+                    full = None
+        except OSError:
+            full = None
+
+        with self._lock:
+            if full is None:
+                self._drop(entry)
+            else:
+                entry["full"] = full
+
+    def duplicates(self):
+        """
+        Returns {key: [paths]} for every key shared by more than one file.
+        """
+        result = {}
+        with self._lock:
+            for entry in self._memo.values():
+                result.setdefault(entry["key"], []).append(entry["path"])
+        return {k: v for k, v in result.items() if len(v) > 1}
+
+    # Background hashing
+    def submit(self, paths, callback=None):
+        """
+        Hash files in the background thread pool.
+
+        :param paths: file paths to hash
+        :param callback: optional callable(path, key) run on the worker thread
+        :return: list of futures
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def job(p):
+            try:
+                key = self.key_for(p)
+            except OSError as e:
+                print("Hashing failed:", p, e)
+                return None
+            if callback:
+                callback(p, key)
+            return key
+
+        return [self._executor.submit(job, p) for p in paths]
+
+    def shutdown(self, wait=False):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    # Persistence
+    def load(self):
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "r") as f:
+            data = json.load(f)
+        # Older indexes are a plain list of entries
+        if isinstance(data, list):
+            data = {"entries": data, "retired": []}
+
+        with self._lock:
+            self._retired.update(data.get("retired", []))
+            stale = set()
+            for item in data["entries"]:
+                # Skip files edited, replaced or removed since the save
+                skey = tuple(item["stat"])
+                try:
+                    current = stat_key(item["path"]) == skey
+                except OSError:
+                    current = False
+                if current:
+                    self._add(skey, item["path"], item["sampled"], item.get("full"), item["key"])
+                elif item["key"] == item["sampled"]:
+                    stale.add(item["key"])
+            live = set(entry["key"] for entry in self._memo.values())
+            self._retired.update(stale - live)
+
+    def save(self):
+        if not self.index_path:
+            return
+        with self._lock:
+            data = {
+                "entries": [dict(entry, stat=list(entry["stat"])) for entry in self._memo.values()],
+                "retired": sorted(self._retired),
+            }
+
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        with open(self.index_path, "w") as f:
+            json.dump(data, f, indent=4)
@@ -4,8 +4,26 @@ except: # newer DCC versions
     from PySide6 import QtWidgets, QtCore, QtGui
 import os
 from .utils import flat_thumbnail_name
+from .hashing import content_thumbnail_name
 
 
+def decode_thumbnail(thumb_path, icon_size=96):
+    """
+    Load and scale a thumbnail into a QImage (safe off the GUI thread).
+    Returns (image, nbytes) or None if it can not be read.
+    """
+    image = QtGui.QImage(thumb_path)
+    if image.isNull():
+        return None
+    image = image.scaled(
+        icon_size,
+        icon_size,
+        QtCore.Qt.KeepAspectRatio,
+        QtCore.Qt.SmoothTransformation
+    )
+    nbytes = image.sizeInBytes() if hasattr(image, "sizeInBytes") else image.byteCount()
+    return image, nbytes
+
 
 class CustomIconProvider(QtWidgets.QFileIconProvider):
     """
@@ -15,11 +33,30 @@ class CustomIconProvider(QtWidgets.QFileIconProvider):
     Parameters:
         thumbnail_root (str): Directory containing generated thumbnails.
         icon_size (int): Target size (width/height) for displayed icons.
+        hash_index (ContentHashIndex): Optional index, when set thumbnails
+            of already hashed files are looked up by content key.
+        prefetcher (Prefetcher): Optional cache of decoded thumbnails.
     """
-    def __init__(self, thumbnail_root, icon_size=96):
+    def __init__(self, thumbnail_root, icon_size=96, hash_index=None, prefetcher=None):
         super().__init__()
         self.thumbnail_root = thumbnail_root
         self.icon_size = icon_size
+        self.hash_index = hash_index
+        self.prefetcher = prefetcher
+
+    def thumbnail_path(self, file_path):
+        return os.path.join(self.thumbnail_root, self.thumbnail_name(file_path))
+
+    def thumbnail_name(self, file_path):
+        """
+        Content key based name if the file is hashed already,
+        path based name otherwise.
+        """
+        if self.hash_index is not None:
+            key = self.hash_index.cached_key(file_path)
+            if key:
+                return content_thumbnail_name(key)
+        return flat_thumbnail_name(file_path)
 
     def icon(self, fileInfo):
         """
@@ -31,11 +68,15 @@ class CustomIconProvider(QtWidgets.QFileIconProvider):
         # Ensure we are handling a file (not a directory)
         if  isinstance(fileInfo, QtCore.QFileInfo) and fileInfo.isFile():
             file_path = fileInfo.absoluteFilePath()
-            name = flat_thumbnail_name(file_path)
+            name = self.thumbnail_name(file_path)
             thumb_path = os.path.join(self.thumbnail_root, name)
             
             # Check if thumbnail file exists
-            if os.path.exists(thumb_path):
+            if os.path.exists(thumb_path) and self.prefetcher is not None:
+                image = self.prefetcher.thumbnail(thumb_path)
+                if image is not None:
+                    return QtGui.QIcon(QtGui.QPixmap.fromImage(image))
+            elif os.path.exists(thumb_path):
                 pix = QtGui.QPixmap(thumb_path)
                 if not pix.isNull():
                     pix = pix.scaled(
@@ -0,0 +1,142 @@
+import os
+import re
+import time
+import maya.cmds as cmds
+
+from .thumbnails import ensure_import_plugin, translator_flags
+
+IMPORT_MODES = ("import", "reference", "proxy")
+
+# Auto mode: files above this size come in as proxies
+LARGE_FILE_MB = 200
+
+
+def asset_namespace(model_path):
+    """
+    Unique namespace derived from the file name, e.g. "hero", "hero1".
+    """
+    base = os.path.splitext(os.path.basename(model_path))[0]
+    base = re.sub(r"\W", "_", base)
+    if not base or base[0].isdigit():
+        base = "asset_" + base
+    name = base
+    index = 1
+    while cmds.namespace(exists=":" + name):
+        name = "{}{}".format(base, index)
+        index += 1
+    return name
+
+
+def choose_mode(model_path, mode="auto", large_file_mb=LARGE_FILE_MB):
+    """
+    Resolve "auto" to "proxy" for large files and "import" otherwise.
+    """
+    if mode != "auto":
+        return mode
+    size_mb = os.path.getsize(model_path) / (1024.0 * 1024.0)
+    return "proxy" if size_mb > large_file_mb else "import"
+
+
+def import_asset(model_path, mode="import"):
+    """
+    Bring one asset into the current scene under its own namespace.
+
+    :param mode: "import" copies the nodes into the scene,
+        "reference" creates a loaded file reference,
+        "proxy" creates an unloaded (deferred) reference that costs almost
+        nothing until it is loaded from the Reference Editor
+    :return: dict with model, mode, namespace, new nodes, seconds and error
+    """
+    if mode not in IMPORT_MODES:
+        raise ValueError("Unknown import mode: {}".format(mode))
+
+    start = time.time()
+    result = {"model": model_path, "mode": mode, "namespace": None, "nodes": [], "seconds": 0.0, "error": None}
+    try:
+        ensure_import_plugin(model_path)
+        namespace = asset_namespace(model_path)
+        flags = dict(translator_flags(model_path), namespace=namespace, returnNewNodes=True)
+
+        # returnNewNodes keeps all follow-up work to what was just created
+        if mode == "import":
+            nodes = cmds.file(model_path, i=True, ignoreVersion=True, **flags)
+        else:
+            nodes = cmds.file(model_path, reference=True, deferReference=(mode == "proxy"), **flags)
+
+        result["namespace"] = namespace
+        result["nodes"] = nodes or []
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = round(time.time() - start, 3)
+    return result
+
+
+class BatchImportQueue(object):
+    """
+    Imports several assets in one go.
+
+    Viewport refresh is suspended and the whole batch is one undo chunk;
+    each asset lands in its own namespace and only its returned new nodes
+    are touched, so the cost grows with the assets, not the scene.
+
+    Parameters:
+        mode (str): "import", "reference", "proxy" or "auto".
+        large_file_mb (float): Size above which "auto" uses a proxy.
+    """
+    def __init__(self, mode="auto", large_file_mb=LARGE_FILE_MB):
+        self.mode = mode
+        self.large_file_mb = large_file_mb
+        self._paths = []
+        self.results = []
+
+    def add(self, model_path):
+        if model_path not in self._paths:
+            self._paths.append(model_path)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def run(self, progress=None):
+        """
+        Import every queued asset.
+
+        :param progress: optional callable(index, total, result) called after
+            each asset; returning False cancels the rest
+        :return: list of per-asset results (see import_asset)
+        """
+        self.results = []
+        total = len(self._paths)
+        cmds.undoInfo(openChunk=True, chunkName="Batch import")
+        cmds.refresh(suspend=True)
+        try:
+            for i, model_path in enumerate(self._paths):
+                try:
+                    mode = choose_mode(model_path, self.mode, self.large_file_mb)
+                except OSError:
+                    # Missing file, import_asset reports the error
+                    mode = "import"
+                result = import_asset(model_path, mode)
+                self.results.append(result)
+                if progress is not None and progress(i + 1, total, result) is False:
+                    break
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
+
+        # Select just the new top level nodes
+        nodes = [n for r in self.results for n in r["nodes"]]
+        roots = cmds.ls(nodes, assemblies=True, long=True) if nodes else []
+        if roots:
+            cmds.select(roots, replace=True)
+        self._paths = []
+        return self.results
+
+    def summary(self):
+        """
+        One line per asset with its import time, slowest first.
+        """
+        lines = []
+        for r in sorted(self.results, key=lambda r: r["seconds"], reverse=True):
+            state = "ERROR: " + r["error"] if r["error"] else "{} nodes in :{}".format(len(r["nodes"]), r["namespace"])
+            lines.append("{:8.3f}s  {:9}  {}  {}".format(r["seconds"], r["mode"], os.path.basename(r["model"]), state))
+        return "\n".join(lines)
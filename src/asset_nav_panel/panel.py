@@ -2,6 +2,8 @@
 import os
 import traceback
 import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import maya.cmds as cmds
 
 # Qt imports with compatibility
@@ -18,10 +20,33 @@ except Exception:
     from PySide2.QtMultimediaWidgets import QVideoWidget
     IS_PYSIDE2 = True
 
-from .icon import CustomIconProvider
+from .icon import CustomIconProvider, decode_thumbnail
 from .utils import flat_thumbnail_name, append_error_report, SUPPORTED_EXT, THUMBNAIL_DIR, error_report_path
-from .thumbnails import save_gif_thumbnail, save_thumbnail_png
+from .thumbnails import (save_gif_thumbnail, save_thumbnail_png, ImportBudget, AssetTooLargeError,
+                         MissingPluginError, session_memory_mb, release_scene_memory)
 from .analyze_panel import show_analyze_panel
+from .hashing import ContentHashIndex, content_thumbnail_name
+from .render_server import RenderClient
+from .rollups import FolderRollups, ReportCache
+from .sniff import sniff_metadata, format_metadata
+from .softrender import submit_obj_thumbnails
+from .prefetch import Prefetcher
+from .importer import BatchImportQueue
+
+# Scene memory above which the session is cleaned between thumbnail jobs
+MEMORY_LIMIT_MB = 6144
+
+
+class _WorkerSignals(QtCore.QObject):
+    """
+    Carries results from worker threads (hash pool, render server client)
+    to the GUI thread.
+    """
+    hashed = QtCore.Signal(str, str)
+    render_result = QtCore.Signal(dict)
+    sniffed = QtCore.Signal(str, object)
+    counted = QtCore.Signal(str, int)
+    stale = QtCore.Signal(list)
 
 class FolderNavWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
@@ -31,8 +56,50 @@ class FolderNavWidget(QtWidgets.QWidget):
 
         self.setWindowFlags(QtCore.Qt.WindowStaysOnTopHint)
 
+        # Content-hash deduplication (optional)
+        self._hash_index = ContentHashIndex(os.path.join(THUMBNAIL_DIR, "content_index.json"))
+        try:
+            self._hash_index.load()
+        except Exception as e:
+            print("Could not load content index:", e)
+        self._signals = _WorkerSignals(self)
+
+        # Oversized assets get a proxy preview instead of a full import
+        self._import_budget = ImportBudget()
+        self.job_stats = []
+
+        # Per-folder statistics rolled up from cached analysis reports
+        self._report_cache = ReportCache(os.path.join(THUMBNAIL_DIR, "analysis_reports.json"))
+        try:
+            self._report_cache.load()
+        except Exception as e:
+            print("Could not load analysis reports:", e)
+        # Filled from the cache as is, stale reports are removed once the
+        # folder pool has checked them
+        self._rollups = FolderRollups()
+        self._report_cache.fill(self._rollups)
+        self._folder_watcher = QtCore.QFileSystemWatcher(self)
+
+        # Header metadata shown as tooltips, read in the background
+        self._metadata = {}
+
+        # Background folder work (listing, sniffing, hashing). Only the
+        # current folder's work survives navigation
+        self._folder_pool = ThreadPoolExecutor(max_workers=4)
+        self._folder_futures = []
+        self._current_folder = None
+        self._pending_folder = None
+
+        # Persistent render server client, connected on first use
+        self._render_client = None
+        self._render_backlog = []
+        self._render_total = 0
+        self._render_done = 0
+        self._render_dropped = 0
+
         self._build_ui()
         self._connect_signals()
+        self._check_stale_reports()
 
     def _build_ui(self):
         main_layout = QtWidgets.QVBoxLayout(self)
@@ -53,6 +120,31 @@ class FolderNavWidget(QtWidgets.QWidget):
         self.analyze_btn = QtWidgets.QPushButton("Analyze")
         top_row.addWidget(self.analyze_btn)
 
+        self.dedupe_check = QtWidgets.QCheckBox("Dedupe by content")
+        self.dedupe_check.setToolTip("Identical files share one thumbnail and one analysis report")
+        top_row.addWidget(self.dedupe_check)
+
+        self.server_check = QtWidgets.QCheckBox("Render server")
+        self.server_check.setToolTip("Send thumbnail and analyze jobs to a running render server instead of this session")
+        top_row.addWidget(self.server_check)
+
+        self.renderer_combo = QtWidgets.QComboBox()
+        self.renderer_combo.addItem("Maya playblast", "playblast")
+        self.renderer_combo.addItem("Software (OBJ)", "software")
+        self.renderer_combo.setToolTip("Software renders OBJ thumbnails on all cores without the viewport")
+        top_row.addWidget(self.renderer_combo)
+
+        self.import_btn = QtWidgets.QPushButton("Import")
+        self.import_btn.setToolTip("Import the selected assets, each into its own namespace")
+        top_row.addWidget(self.import_btn)
+
+        self.import_mode_combo = QtWidgets.QComboBox()
+        self.import_mode_combo.addItem("Auto (proxy large)", "auto")
+        self.import_mode_combo.addItem("Import", "import")
+        self.import_mode_combo.addItem("Reference", "reference")
+        self.import_mode_combo.addItem("Proxy (unloaded ref)", "proxy")
+        top_row.addWidget(self.import_mode_combo)
+
         # Splitter: directory tree | file list
         splitter = QtWidgets.QSplitter()
         splitter.setOrientation(QtCore.Qt.Horizontal)
@@ -81,6 +173,14 @@ class FolderNavWidget(QtWidgets.QWidget):
         )
         self.file_model.setIconProvider(self._icon_provider)
 
+        # Warms listings and thumbnails of neighbouring folders
+        self._prefetcher = Prefetcher(
+            SUPPORTED_EXT,
+            thumbnail_path=self._icon_provider.thumbnail_path,
+            decode=lambda path: decode_thumbnail(path, self._icon_provider.icon_size),
+        )
+        self._icon_provider.prefetcher = self._prefetcher
+
         name_filters = ["*{}".format(ext) for ext in SUPPORTED_EXT]
         self.file_model.setNameFilters(name_filters)
         self.file_model.setNameFilterDisables(False)
@@ -135,6 +235,12 @@ class FolderNavWidget(QtWidgets.QWidget):
         self._hover_timer.setInterval(150)
         self._hover_timer.timeout.connect(self._on_hover_timeout)
 
+        # Navigation timer: tree selections settle before the folder loads
+        self._nav_timer = QtCore.QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(200)
+        self._nav_timer.timeout.connect(self._apply_pending_folder)
+
         # List view
         self.list_view = QtWidgets.QListView()
         self.list_view.setModel(self.file_model)
@@ -146,6 +252,7 @@ class FolderNavWidget(QtWidgets.QWidget):
         self.list_view.setGridSize(QtCore.QSize(120, 140))
         self.list_view.setMovement(QtWidgets.QListView.Static)
         self.list_view.setMouseTracking(True)
+        self.list_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.list_view.viewport().installEventFilter(self)
 
         splitter.addWidget(self.list_view)
@@ -157,9 +264,12 @@ class FolderNavWidget(QtWidgets.QWidget):
 
         self.selected_label = QtWidgets.QLabel("Selected folder: ")
         self.status = QtWidgets.QLabel("")
+        self.rollup_label = QtWidgets.QLabel("")
+        self.rollup_label.setToolTip("Totals of analyzed assets in this folder tree")
 
         bottom_layout.addWidget(self.selected_label)
         bottom_layout.addStretch()
+        bottom_layout.addWidget(self.rollup_label)
         bottom_layout.addWidget(self.status)
 
         self.selected_label.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
@@ -192,6 +302,13 @@ class FolderNavWidget(QtWidgets.QWidget):
                 self._hover_index = None
                 self._hide_video_preview()
 
+            elif event.type() == QtCore.QEvent.ToolTip:
+                idx = self.list_view.indexAt(event.pos())
+                meta = self._metadata.get(self.file_model.filePath(idx)) if idx.isValid() else None
+                if meta:
+                    QtWidgets.QToolTip.showText(event.globalPos(), format_metadata(meta), self.list_view.viewport())
+                    return True
+
         return super(FolderNavWidget, self).eventFilter(obj, event)
 
     def _hide_video_preview(self):
@@ -244,7 +361,7 @@ class FolderNavWidget(QtWidgets.QWidget):
             self._hide_video_preview()
             return
 
-        thumb_name = flat_thumbnail_name(file_path)
+        thumb_name = self._icon_provider.thumbnail_name(file_path)
         avi_path = os.path.join(THUMBNAIL_DIR, thumb_name) + ".avi"
 
         if not os.path.exists(avi_path):
@@ -295,6 +412,14 @@ class FolderNavWidget(QtWidgets.QWidget):
         self.list_view.doubleClicked.connect(self.on_file_double_click)
         self.gen_all_btn.clicked.connect(self.generate_all_thumbnails_flat)
         self.analyze_btn.clicked.connect(self.on_analyze_clicked)
+        self.import_btn.clicked.connect(self.on_import_clicked)
+        self.dedupe_check.toggled.connect(self.on_dedupe_toggled)
+        self._signals.hashed.connect(self._on_file_hashed)
+        self._signals.render_result.connect(self._on_render_result)
+        self._signals.sniffed.connect(self._on_file_sniffed)
+        self._signals.counted.connect(self._on_files_counted)
+        self._signals.stale.connect(self._on_reports_stale)
+        self._folder_watcher.directoryChanged.connect(self._check_stale_reports)
 
     # Slots and other methods kept largely unchanged (trimmed here for brevity)
     def on_browse(self):
@@ -311,6 +436,10 @@ class FolderNavWidget(QtWidgets.QWidget):
             self.status.setText("Invalid folder: {}".format(path))
     # 
     def set_folder(self, folder_path):
+        self._nav_timer.stop()
+        self._pending_folder = None
+        self._cancel_folder_work()
+        self._current_folder = folder_path
         self.path_edit.setText(folder_path)
         self.selected_label.setText("Selected folder: {}".format(folder_path))
         index = self.dir_model.index(folder_path)
@@ -320,10 +449,185 @@ class FolderNavWidget(QtWidgets.QWidget):
         file_index = self.file_model.index(folder_path)
         if file_index.isValid():
             self.list_view.setRootIndex(file_index)
-        self.status.setText("Found: {} files".format(self._count_files(folder_path)))
+
+        # Count from the cached listing when the folder is unchanged, else
+        # list it once off the GUI thread. This is the navigation's one
+        # counted prefetch lookup
+        listing = self._prefetcher.listing(folder_path, cached_only=True)
+        if listing is None:
+            self.status.setText("Counting files...")
+        else:
+            self.status.setText("Found: {} files".format(len(listing)))
+        self._load_folder(folder_path, listing, self.dedupe_check.isChecked())
+        self._watch_folder(folder_path)
+        # Catch edits made while this folder was not watched
+        self._check_stale_reports(folder_path)
+        self._update_rollup_label()
+        self._prefetcher.prefetch_around(folder_path)
+        self._update_prefetch_stats()
+
+    # Folder rollups
+    def _watch_folder(self, folder):
+        watched = self._folder_watcher.directories()
+        if watched:
+            self._folder_watcher.removePaths(watched)
+        if os.path.isdir(folder):
+            self._folder_watcher.addPath(folder)
+
+    def _check_stale_reports(self, folder=None):
+        """
+        Stat the cached reports of folder (all of them if None) on the
+        folder pool. Rollups are tree-wide, so the check is not cancelled
+        by navigation.
+        """
+        def job():
+            stale = self._report_cache.stale_in(folder)
+            if stale:
+                self._signals.stale.emit(stale)
+
+        self._folder_pool.submit(job)
+
+    def _on_reports_stale(self, paths):
+        # Changed or deleted assets drop out of their ancestor chain only
+        for path in paths:
+            self._rollups.remove_asset(path)
+        self._update_rollup_label()
+
+    def _on_asset_analyzed(self, path, report):
+        self._report_cache.put(path, report)
+        self._rollups.update_asset(path, report)
+
+    def _update_rollup_label(self):
+        totals = self._rollups.totals(self.path_edit.text())
+        if not totals["files"]:
+            self.rollup_label.setText("")
+            return
+        self.rollup_label.setText(
+            "Tree: {files:,} analyzed | {meshes:,} meshes | {polygons:,} polys | "
+            "{ngons:,} ngons | {broken:,} broken".format(**totals)
+        )
+
+    # Content-hash deduplication
+    def on_dedupe_toggled(self, checked):
+        self._icon_provider.hash_index = self._hash_index if checked else None
+        if checked:
+            self._hash_folder(self.path_edit.text())
+        self.refresh_icon()
+
+    # Navigation
+    def _apply_pending_folder(self):
+        if self._pending_folder and self._pending_folder != self._current_folder:
+            self.set_folder(self._pending_folder)
+
+    def _cancel_folder_work(self):
+        # Queued jobs of the previous folder are dropped, running ones
+        # notice the folder change and stop
+        self._prefetcher.cancel()
+        for future in self._folder_futures:
+            future.cancel()
+        self._folder_futures = []
+
+    def _is_current(self, folder):
+        return folder == self._current_folder
+
+    def _on_files_counted(self, folder, count):
+        if self._is_current(folder):
+            self.status.setText("Found: {} files".format(count))
+
+    def _asset_paths(self, folder):
+        if not os.path.isdir(folder):
+            return []
+        # Follow-up lookups, set_folder already recorded the hit or miss.
+        # A scan stops once the user navigated elsewhere
+        paths = self._prefetcher.listing(folder, record=False, is_current=lambda: self._is_current(folder))
+        return paths or []
+
+    def _load_folder(self, folder, listing, dedupe):
+        """
+        Background work of a newly opened folder: list it (unless the
+        listing was cached), then hash and sniff its assets from that
+        one listing.
+        """
+        def job():
+            paths = listing
+            if paths is None:
+                paths = self._asset_paths(folder)
+                if not self._is_current(folder):
+                    return
+                self._signals.counted.emit(folder, len(paths))
+            if dedupe:
+                self._hash_paths(folder, paths)
+            self._sniff_paths(folder, paths)
+
+        self._folder_futures.append(self._folder_pool.submit(job))
+
+    def _update_prefetch_stats(self):
+        stats = self._prefetcher.stats()
+        self.status.setToolTip(
+            "Prefetch hit rate: listings {:.0%}, thumbnails {:.0%}\n"
+            "Prefetched {} listings, {} thumbnails ({:.1f} MB cached)".format(
+                stats["listing_hit_rate"], stats["thumbnail_hit_rate"],
+                stats["prefetched_listings"], stats["prefetched_thumbnails"],
+                stats["cache_bytes"] / (1024.0 * 1024.0)))
+
+    def _hash_folder(self, folder):
+        self._folder_futures.append(
+            self._folder_pool.submit(lambda: self._hash_paths(folder, self._asset_paths(folder))))
+
+    def _hash_paths(self, folder, paths):
+        # Runs on the folder pool
+        paths = [p for p in paths if self._hash_index.cached_key(p) is None]
+        if self._is_current(folder):
+            # Emitting from the pool thread queues the slot onto the GUI thread
+            self._folder_futures.extend(
+                self._hash_index.submit(paths, callback=self._signals.hashed.emit))
+
+    def _on_file_hashed(self, path, key):
+        self.list_view.viewport().update()
+
+    # Header metadata
+    def _sniff_paths(self, folder, paths):
+        # Runs on the folder pool, stops when the user navigates away
+        for path in paths:
+            if not self._is_current(folder):
+                return
+            if QtCore.QDir.fromNativeSeparators(path) in self._metadata:
+                continue
+            try:
+                meta = sniff_metadata(path)
+            except OSError as e:
+                print("Sniff failed:", path, e)
+                continue
+            self._signals.sniffed.emit(path, meta)
+
+    def _on_file_sniffed(self, path, meta):
+        # Paths from os.path.join, tooltips look up Qt's forward slash paths
+        self._metadata[QtCore.QDir.fromNativeSeparators(path)] = meta
+
+    def closeEvent(self, event):
+        self._hash_index.shutdown()
+        self._cancel_folder_work()
+        self._folder_pool.shutdown(wait=False)
+        self._prefetcher.shutdown()
+        if self._render_client is not None:
+            self._render_client.close()
+        if self.dedupe_check.isChecked():
+            self._hash_index.save()
+        super(FolderNavWidget, self).closeEvent(event)
+
+    def _thumbnail_name(self, file_path):
+        """
+        Thumbnail name used for generation. In dedupe mode the file is
+        hashed now if the background pool has not reached it yet.
+        """
+        if self.dedupe_check.isChecked():
+            return content_thumbnail_name(self._hash_index.key_for(file_path))
+        return flat_thumbnail_name(file_path)
 
     # refresh the file icons
     def refresh_icon(self):
+        # Thumbnails may have been regenerated, drop decoded copies
+        self._prefetcher.thumbnails.clear()
         self.file_model.setIconProvider(self._icon_provider)
         self.list_view.viewport().update()
 
@@ -336,8 +640,109 @@ class FolderNavWidget(QtWidgets.QWidget):
             QtWidgets.QMessageBox.information(self, "Analyze", "No assets selected.")
             return
         print("ANALYZE", paths)
-        show_analyze_panel(paths, parent=self)
+        hash_index = self._hash_index if self.dedupe_check.isChecked() else None
+        # Analyze on the render server when enabled, this session stays free
+        render_client = None
+        if self.server_check.isChecked() and self._connect_render_server():
+            render_client = self._render_client
+        show_analyze_panel(paths, parent=self, hash_index=hash_index, on_report=self._on_asset_analyzed,
+                           render_client=render_client, result_signal=self._signals.render_result)
+        self._report_cache.save()
+        self._update_rollup_label()
+
+
+    # Render server
+    def _connect_render_server(self):
+        if self._render_client is not None and self._render_client.connected:
+            return True
+        client = RenderClient(on_result=self._signals.render_result.emit)
+        try:
+            client.connect()
+        except OSError as e:
+            QtWidgets.QMessageBox.warning(
+                self, "Render server",
+                "Could not connect to the render server:\n{}".format(e))
+            return False
+        self._render_client = client
+        return True
+
+    def _generate_via_server(self, force=False):
+        """
+        Queue PNG and turntable jobs for the current folder on the render
+        server. Results stream back through _on_render_result, so the
+        session stays usable while the batch runs.
+        """
+        if not self._connect_render_server():
+            return
+        # A mayapy server renders thumbnails only, no turntables
+        turntables = "turntable" in self._render_client.kinds
+        root_index = self.list_view.rootIndex()
+        model = self.file_model
+        for row in range(model.rowCount(root_index)):
+            file_path = model.filePath(model.index(row, 0, root_index))
+            if not os.path.isfile(file_path):
+                continue
+            thumb_path = os.path.join(THUMBNAIL_DIR, self._thumbnail_name(file_path))
+            if os.path.exists(thumb_path) and not force:
+                continue
+            self._render_backlog.append(("thumbnail", file_path, thumb_path))
+            self._render_total += 1
+            if turntables:
+                self._render_backlog.append(("turntable", file_path, thumb_path + ".avi"))
+                self._render_total += 1
+        self._feed_render_server()
+        self._update_render_status()
+
+    def _feed_render_server(self):
+        # Submit only while the client has free slots, never block the GUI
+        while self._render_backlog:
+            kind, file_path, output = self._render_backlog[0]
+            size = 256 if kind == "thumbnail" else 800
+            try:
+                self._render_client.submit(kind, file_path, output=output, size=size, timeout=0)
+            except TimeoutError:
+                break
+            except ConnectionError as e:
+                # The client gave up reconnecting, the rest of the batch is dropped
+                print("Render server unavailable:", e)
+                self._render_dropped += len(self._render_backlog)
+                self._render_total -= len(self._render_backlog)
+                self._render_backlog = []
+                break
+            self._render_backlog.pop(0)
 
+    def _on_render_result(self, msg):
+        # Analyze results belong to the open analysis dialog
+        if msg.get("kind") == "analyze":
+            return
+        self._render_done += 1
+        if msg["type"] == "error":
+            print("Render server job failed:", msg.get("kind"), msg["error"])
+            error_entry = {
+                "render_server": True,
+                "user": os.getlogin(),
+                "job": msg.get("kind"),
+                "error": msg["error"],
+                "created_at": datetime.datetime.utcnow().isoformat() + "Z"
+            }
+            append_error_report(error_report_path, error_entry)
+        elif msg.get("kind") == "thumbnail":
+            self.refresh_icon()
+
+        self._feed_render_server()
+        self._update_render_status()
+
+    def _update_render_status(self):
+        if self._render_done >= self._render_total:
+            text = "Render server finished {} jobs".format(self._render_done)
+            if self._render_dropped:
+                text += ", {} not sent (connection lost)".format(self._render_dropped)
+            self.status.setText(text)
+            self._render_total = self._render_done = self._render_dropped = 0
+            if self.dedupe_check.isChecked():
+                self._hash_index.save()
+        else:
+            self.status.setText("Render server: {}/{} jobs".format(self._render_done, self._render_total))
 
     # Genereta GIF and PNG thumbnail
     def generate_all_thumbnails_flat(self, force=False):
@@ -345,6 +750,9 @@ class FolderNavWidget(QtWidgets.QWidget):
         root_index = self.list_view.rootIndex()
         if not root_index.isValid():
             return
+        if self.server_check.isChecked():
+            self._generate_via_server(force)
+            return
         model = self.file_model
         row_count = model.rowCount(root_index)
 
@@ -355,27 +763,56 @@ class FolderNavWidget(QtWidgets.QWidget):
         progress.setValue(0)
 
         generated = 0
+        skipped = 0
+        recycles = 0
+        self.job_stats = []
         current_panel = cmds.getPanel(withFocus=True)
         current_widget = QtWidgets.QApplication.focusWidget()
 
+        # OBJ files go to the software renderer's process pool and render
+        # on all cores while the playblast loop handles the other formats
+        software_jobs = []
+        if self.renderer_combo.currentData() == "software":
+            for row in range(row_count):
+                file_path = model.filePath(model.index(row, 0, root_index))
+                if os.path.isfile(file_path) and file_path.lower().endswith(".obj"):
+                    thumb_path = os.path.join(THUMBNAIL_DIR, self._thumbnail_name(file_path))
+                    if force or not os.path.exists(thumb_path):
+                        software_jobs.append((file_path, thumb_path))
+        software_pool, software_futures = None, {}
+        if software_jobs:
+            try:
+                software_pool, software_futures = submit_obj_thumbnails(software_jobs)
+            except RuntimeError as e:
+                print("Software renderer unavailable, using playblast:", e)
+                software_jobs = []
+        software_paths = set(path for path, _ in software_jobs)
+
         for row in range(row_count):
             QtWidgets.QApplication.processEvents()
             if progress.wasCanceled():
                 break
             idx = model.index(row, 0, root_index)
             file_path = model.filePath(idx)
-            if not os.path.isfile(file_path):
+            if not os.path.isfile(file_path) or file_path in software_paths:
                 progress.setValue(row + 1)
                 continue
-            thumb_name = flat_thumbnail_name(file_path)
+            thumb_name = self._thumbnail_name(file_path)
             thumb_path = os.path.join(THUMBNAIL_DIR, thumb_name)
             if os.path.exists(thumb_path) and not force:
                 progress.setValue(row + 1)
                 continue
+            start = time.time()
+            memory_before = session_memory_mb()
             try:
-                save_thumbnail_png(file_path, thumb_path)
-                save_gif_thumbnail(file_path, thumb_path + ".avi")
+                info = save_thumbnail_png(file_path, thumb_path, budget=self._import_budget)
+                save_gif_thumbnail(file_path, thumb_path + ".avi", budget=self._import_budget)
                 generated += 1
+                self._record_job(file_path, info["mode"], start, memory_before)
+            except (AssetTooLargeError, MissingPluginError) as e:
+                print("Thumbnail skipped:", file_path, e)
+                skipped += 1
+                self._record_job(file_path, "skipped", start, memory_before)
             except Exception as e:
                 print("Thumbnail failed:", file_path, e)
                 error_entry = {
@@ -389,8 +826,18 @@ class FolderNavWidget(QtWidgets.QWidget):
                     "created_at": datetime.datetime.utcnow().isoformat() + "Z"
                 }
                 append_error_report(error_report_path, error_entry)
+
+            # Clean the session once it grows past the limit
+            memory = session_memory_mb()
+            if memory is not None and memory > MEMORY_LIMIT_MB:
+                print("Session memory {:.0f} MB over limit, releasing scene".format(memory))
+                release_scene_memory()
+                recycles += 1
             progress.setValue(row + 1)
 
+        if software_pool is not None:
+            generated += self._collect_software_thumbnails(software_pool, software_futures, progress)
+
         def restore_focus():
             if current_panel:
                 cmds.setFocus(current_panel)
@@ -399,30 +846,125 @@ class FolderNavWidget(QtWidgets.QWidget):
 
         cmds.evalDeferred(restore_focus)
         progress.close()
-        self.status.setText("Generated {} thumbnails".format(generated))
+        self.status.setText("Generated {} thumbnails, skipped {} (oversized or missing plugins), {} memory releases".format(
+            generated, skipped, recycles))
+        if self.dedupe_check.isChecked():
+            self._hash_index.save()
         cmds.file(new=True, force=True)
         self.refresh_icon()
 
+    def _collect_software_thumbnails(self, pool, futures, progress):
+        """
+        Wait for the software renderer while keeping the UI responsive.
+        Returns the number of thumbnails written.
+        """
+        generated = 0
+        pending = set(futures)
+        progress.setLabelText("Rendering OBJ thumbnails...")
+        progress.setRange(0, len(futures))
+        while pending:
+            QtWidgets.QApplication.processEvents()
+            if progress.wasCanceled():
+                for future in pending:
+                    future.cancel()
+                break
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = None if future.cancelled() else future.exception()
+                if error:
+                    print("Software thumbnail failed:", futures[future], error)
+                    append_error_report(error_report_path, {
+                        "renderer": "software",
+                        "user": os.getlogin(),
+                        "model": futures[future],
+                        "error": str(error),
+                        "created_at": datetime.datetime.utcnow().isoformat() + "Z"
+                    })
+                else:
+                    generated += 1
+            progress.setValue(len(futures) - len(pending))
+        pool.shutdown(wait=False)
+        return generated
+
+    def _record_job(self, file_path, mode, start, memory_before):
+        memory_after = session_memory_mb()
+        stats = {
+            "model": file_path,
+            "mode": mode,
+            "seconds": round(time.time() - start, 3),
+            "memory_before_mb": memory_before,
+            "memory_after_mb": memory_after,
+        }
+        self.job_stats.append(stats)
+
     def on_tree_selection_changed(self, current):
+        # Debounced: arrowing through the tree only loads where it stops
         path = self.dir_model.filePath(current)
-        if path:
-            self.set_folder(path)
+        if path and path != self._current_folder:
+            self._pending_folder = path
+            self._cancel_folder_work()
+            self._nav_timer.start()
 
     def on_file_double_click(self, index):
         file_path = self.file_model.filePath(index)
         print("Double-clicked file:", file_path)
-        self.status.setText("Double-clicked: {}".format(os.path.basename(file_path)))
-        cmds.file(file_path, i=True, ignoreVersion=True)
-        cmds.select(all=True)
-        cmds.displaySurface(all=True)
+        # Double-clicking inside a multi-selection imports the whole selection
+        paths = self._selected_asset_paths()
+        if file_path not in paths:
+            paths = [file_path]
+        self.import_assets(paths)
+
+    def on_import_clicked(self):
+        paths = self._selected_asset_paths()
+        if not paths:
+            QtWidgets.QMessageBox.information(self, "Import", "No assets selected.")
+            return
+        self.import_assets(paths)
 
-    def _count_files(self, folder):
-        try:
-            files = [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
-            files = [f for f in files if os.path.splitext(f)[1].lower() in SUPPORTED_EXT]
-            return len(files)
-        except Exception:
-            return 0
+    def _selected_asset_paths(self):
+        paths = []
+        for idx in self.list_view.selectedIndexes():
+            path = self.file_model.filePath(idx)
+            if os.path.isfile(path) and path not in paths:
+                paths.append(path)
+        return paths
+
+    def import_assets(self, paths):
+        """
+        Import assets through the batch queue and report per-file times.
+        """
+        queue = BatchImportQueue(mode=self.import_mode_combo.currentData())
+        for path in paths:
+            queue.add(path)
+
+        progress = QtWidgets.QProgressDialog("Importing assets...", "Cancel", 0, len(queue), self)
+        progress.setWindowTitle("Batch Import")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def on_progress(done, total, result):
+            progress.setValue(done)
+            progress.setLabelText("Imported {} ({:.2f}s)".format(os.path.basename(result["model"]), result["seconds"]))
+            QtWidgets.QApplication.processEvents()
+            return not progress.wasCanceled()
+
+        start = time.time()
+        results = queue.run(progress=on_progress)
+        progress.close()
+
+        failed = [r for r in results if r["error"]]
+        for r in failed:
+            append_error_report(error_report_path, {
+                "maya_version": cmds.about(version=True),
+                "user": os.getlogin(),
+                "model": r["model"],
+                "import_mode": r["mode"],
+                "error": r["error"],
+                "created_at": datetime.datetime.utcnow().isoformat() + "Z"
+            })
+        print("Batch import:\n" + queue.summary())
+        self.status.setText("Imported {} / {} assets in {:.2f}s".format(
+            len(results) - len(failed), len(paths), time.time() - start))
 
 
 _panel_instance = None
@@ -0,0 +1,246 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ThumbnailCache(object):
+    """
+    LRU cache of decoded thumbnails bounded by their size in bytes.
+
+    Parameters:
+        max_bytes (int): Memory budget for all cached images.
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def put(self, key, value, nbytes):
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.used_bytes -= old[1]
+            self._items[key] = (value, nbytes)
+            self.used_bytes += nbytes
+            while self.used_bytes > self.max_bytes:
+                _, (_, size) = self._items.popitem(last=False)
+                self.used_bytes -= size
+
+    def full(self):
+        return self.used_bytes >= self.max_bytes
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.used_bytes = 0
+
+
+class Prefetcher(object):
+    """
+    Warms the listings and decoded thumbnails of the folders around the
+    current one (children first, then the nearest siblings) so the next
+    navigation is served from memory.
+
+    One background pass runs at a time; prefetch_around() and cancel()
+    abandon the previous pass at its next entry. Each pass reads at most
+    max_read_bytes of thumbnails and max_folders folders, and the
+    decoded images share the ThumbnailCache memory budget.
+
+    Parameters:
+        extensions (list): Asset extensions listed per folder.
+        thumbnail_path (callable): asset path -> thumbnail path.
+        decode (callable): thumbnail path -> (image, nbytes), or None.
+        max_bytes (int): Memory budget of the thumbnail cache.
+        max_read_bytes (int): Thumbnail bytes read per pass.
+        max_folders (int): Folders visited per pass.
+    """
+    def __init__(self, extensions, thumbnail_path, decode, max_bytes=64 * 1024 * 1024,
+                 max_read_bytes=32 * 1024 * 1024, max_folders=12):
+        self.extensions = tuple(extensions)
+        self.thumbnail_path = thumbnail_path
+        self.decode = decode
+        self.max_read_bytes = max_read_bytes
+        self.max_folders = max_folders
+        self.thumbnails = ThumbnailCache(max_bytes)
+
+        self._listings = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._stats = dict.fromkeys(
+            ("listing_hits", "listing_misses", "thumbnail_hits", "thumbnail_misses",
+             "prefetched_listings", "prefetched_thumbnails"), 0)
+
+    # Listings
+    def _list_folder(self, folder, is_current=None):
+        # Returns None, and caches nothing, once is_current() turns False
+        mtime = os.stat(folder).st_mtime_ns
+        paths = []
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if is_current is not None and not is_current():
+                    return None
+                if os.path.splitext(entry.name)[1].lower() in self.extensions and entry.is_file():
+                    paths.append(entry.path)
+        paths.sort()
+        self._listings[folder] = (mtime, paths)
+        return paths
+
+    def _cached_listing(self, folder):
+        entry = self._listings.get(folder)
+        if entry is None:
+            return None
+        try:
+            if os.stat(folder).st_mtime_ns != entry[0]:
+                return None
+        except OSError:
+            return None
+        return entry[1]
+
+    def listing(self, folder, cached_only=False, record=True, is_current=None):
+        """
+        Asset paths of folder, from cache when still valid.
+
+        :param cached_only: return None on a miss instead of listing now
+        :param record: count this lookup as a hit or miss; pass False for
+            follow-up lookups of a folder already looked up once
+        :param is_current: optional callable checked per directory entry,
+            the scan is abandoned and None returned once it is False
+        """
+        paths = self._cached_listing(folder)
+        if record:
+            self._record("listing_hits" if paths is not None else "listing_misses")
+        if paths is not None:
+            return list(paths)
+        if cached_only:
+            return None
+        try:
+            paths = self._list_folder(folder, is_current)
+        except OSError:
+            return []
+        return None if paths is None else list(paths)
+
+    # Thumbnails
+    def thumbnail(self, thumb_path):
+        """
+        Decoded thumbnail from cache, decoding and caching it on a miss.
+        """
+        image = self.thumbnails.get(thumb_path)
+        if image is not None:
+            self._record("thumbnail_hits")
+            return image
+        self._record("thumbnail_misses")
+        result = self.decode(thumb_path)
+        if result is None:
+            return None
+        image, nbytes = result
+        self.thumbnails.put(thumb_path, image, nbytes)
+        return image
+
+    # Prefetch passes
+    @staticmethod
+    def neighbours(folder):
+        """
+        Child folders first, then siblings ordered by distance from folder.
+        """
+        def subfolders(path):
+            try:
+                with os.scandir(path) as entries:
+                    return sorted(e.path for e in entries if e.is_dir())
+            except OSError:
+                return []
+
+        children = subfolders(folder)
+        parent = os.path.dirname(folder)
+        siblings = subfolders(parent) if parent and parent != folder else []
+        if folder in siblings:
+            position = siblings.index(folder)
+            order = sorted(range(len(siblings)), key=lambda i: abs(i - position))
+            siblings = [siblings[i] for i in order if i != position]
+        return children + siblings
+
+    def prefetch_around(self, folder):
+        """
+        Start a background pass around folder, replacing any running pass.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        return self._executor.submit(self._run_pass, folder, generation)
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+
+    def _run_pass(self, folder, generation):
+        def is_current():
+            return generation == self._generation
+
+        read_bytes = 0
+        for target in self.neighbours(folder)[:self.max_folders]:
+            if not is_current():
+                return
+            paths = self._cached_listing(target)
+            if paths is None:
+                try:
+                    paths = self._list_folder(target, is_current)
+                except OSError:
+                    continue
+                if paths is None:
+                    return
+                self._record("prefetched_listings")
+
+            for path in paths:
+                if not is_current() or self.thumbnails.full():
+                    return
+                thumb_path = self.thumbnail_path(path)
+                if thumb_path in self.thumbnails:
+                    continue
+                try:
+                    size = os.path.getsize(thumb_path)
+                except OSError:
+                    continue
+                if read_bytes + size > self.max_read_bytes:
+                    return
+                read_bytes += size
+                result = self.decode(thumb_path)
+                if result is not None:
+                    self.thumbnails.put(thumb_path, result[0], result[1])
+                    self._record("prefetched_thumbnails")
+
+    def _record(self, name):
+        # Counters are bumped from the GUI thread and the pool threads
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self):
+        """
+        Counters plus hit rates, for tuning the budgets.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        for kind in ("listing", "thumbnail"):
+            total = stats[kind + "_hits"] + stats[kind + "_misses"]
+            stats[kind + "_hit_rate"] = float(stats[kind + "_hits"]) / total if total else 0.0
+        stats["cache_bytes"] = self.thumbnails.used_bytes
+        return stats
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,603 @@
+"""
+Persistent local render / analysis server.
+
+A long-lived Maya process keeps its plugins loaded and runs thumbnail,
+turntable and analyze jobs sent by the panel, so batches do not pay Maya
+startup per run and the artist's session is not blocked.
+
+Under mayapy there is no model panel to playblast: thumbnails are
+rendered with the software rasterizer (softrender) and turntable jobs
+are not offered. A second Maya session with UI running serve() runs
+all three kinds.
+
+Protocol: one UTF-8 JSON object per line over a localhost TCP socket.
+
+    client -> server
+        {"type": "job", "id": "...", "kind": "thumbnail" | "turntable" | "analyze",
+         "model": "/path/model.obj", "output": "/path/thumb", "size": 256}
+        {"type": "ping"}
+    server -> client
+        {"type": "accepted", "id": "..."}
+        {"type": "busy", "id": "..."}         queue full, resend later
+        {"type": "result", "id": "...", "kind": "...", "data": {...}}
+        {"type": "error", "id": "...", "kind": "...", "error": "..."}
+        {"type": "pong", "kinds": [...]}      job kinds this server runs
+
+Results carry "stats" with the job time and the worker's memory after it.
+When memory stays above --max-memory-mb after cleaning the scene, the
+server exits with RECYCLE_EXIT_CODE; under --supervise a fresh worker is
+started and clients resend their unfinished jobs after reconnecting.
+
+The client pings on every (re)connect and only sends kinds listed in
+the pong.
+
+Run a server:
+    mayapy -m asset_nav_panel.render_server --supervise   (thumbnail, analyze)
+    python render_server.py --fake      (no Maya, fake rendering)
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import zlib
+import queue
+import socket
+import struct
+import threading
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7521
+JOB_KINDS = ("thumbnail", "turntable", "analyze")
+RECYCLE_EXIT_CODE = 3
+
+
+def encode_message(msg):
+    return (json.dumps(msg) + "\n").encode("utf-8")
+
+
+class _LineSocket(object):
+    """
+    Socket wrapper that sends and receives newline delimited JSON messages.
+    """
+    def __init__(self, sock):
+        self.sock = sock
+        self._buffer = b""
+        self._send_lock = threading.Lock()
+
+    def send(self, msg):
+        with self._send_lock:
+            self.sock.sendall(encode_message(msg))
+
+    def recv(self):
+        """
+        Returns the next message, or None when the peer closed the socket.
+        """
+        while b"\n" not in self._buffer:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                return None
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line.decode("utf-8"))
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+# Job handlers
+class MayaJobHandler(object):
+    """
+    Runs jobs with the real Maya thumbnail and analysis code.
+    Plugins are loaded once in start() and stay loaded for the server's life.
+
+    With UI, thumbnails and turntables playblast through a model panel.
+    In mayapy (batch mode) thumbnails use save_thumbnail_software and
+    turntables are not in `kinds`.
+
+    Parameters:
+        budget (ImportBudget): Optional limits for oversized assets.
+    """
+    plugins = ("fbxmaya", "objExport")
+
+    def __init__(self, budget=None):
+        self.budget = budget
+        self.interactive = True
+        self.kinds = JOB_KINDS
+
+    def start(self):
+        try:
+            import maya.standalone
+            maya.standalone.initialize(name="python")
+        except Exception:
+            # Already running inside an interactive session
+            pass
+
+        import maya.cmds as cmds
+        for plugin in self.plugins:
+            try:
+                cmds.loadPlugin(plugin, quiet=True)
+            except Exception as e:
+                print("Could not load plugin:", plugin, e)
+
+        self.interactive = not cmds.about(batch=True)
+        if not self.interactive:
+            self.kinds = ("thumbnail", "analyze")
+
+    def run(self, job):
+        from .thumbnails import save_thumbnail_png, save_thumbnail_software, save_gif_thumbnail
+        from .analysis import analyze_model
+
+        kind = job["kind"]
+        if kind == "thumbnail":
+            save = save_thumbnail_png if self.interactive else save_thumbnail_software
+            info = save(job["model"], job["output"], size=job.get("size", 256), budget=self.budget)
+            return {"output": job["output"], "import": info}
+        if kind == "turntable":
+            info = save_gif_thumbnail(job["model"], job["output"], size=job.get("size", 800), budget=self.budget)
+            return {"output": job["output"], "import": info}
+        return analyze_model(job["model"])
+
+    def memory_mb(self):
+        from .thumbnails import session_memory_mb
+        return session_memory_mb()
+
+    def recycle(self):
+        from .thumbnails import release_scene_memory
+        release_scene_memory()
+
+
+def write_placeholder_png(png_path, size=256, grey=96):
+    """
+    Write a solid grey PNG without any imaging library.
+    """
+    raw = b"".join(b"\x00" + bytes([grey]) * size for _ in range(size))
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    with open(png_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 0, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw)))
+        f.write(chunk(b"IEND", b""))
+
+
+class FakeJobHandler(object):
+    """
+    Stand-in for MayaJobHandler so the client, protocol, backpressure and
+    reconnect logic can run without Maya.
+
+    Parameters:
+        delay (float): Seconds each job pretends to take.
+        memory_per_job (float): MB each job pretends to leak.
+    """
+    kinds = JOB_KINDS
+
+    def __init__(self, delay=0.0, memory_per_job=0.0):
+        self.delay = delay
+        self.memory_per_job = memory_per_job
+        self.memory = 0.0
+        self.processed = []
+
+    def start(self):
+        pass
+
+    def memory_mb(self):
+        return self.memory
+
+    def recycle(self):
+        # Leaked memory is only returned by restarting the process
+        pass
+
+    def run(self, job):
+        if self.delay:
+            time.sleep(self.delay)
+        if not os.path.isfile(job["model"]):
+            raise RuntimeError("File not found: {}".format(job["model"]))
+
+        self.processed.append(job["id"])
+        self.memory += self.memory_per_job
+        kind = job["kind"]
+        if kind == "thumbnail":
+            write_placeholder_png(job["output"], size=job.get("size", 256))
+            return {"output": job["output"]}
+        if kind == "turntable":
+            with open(job["output"], "wb") as f:
+                f.write(b"FAKE")
+            return {"output": job["output"]}
+        return {
+            "model": job["model"],
+            "meshes": [{"mesh": "fakeShape", "vertices": 8, "polygons": 6, "ngons": 0, "uv_sets": ["map1"]}],
+            "errors": [],
+        }
+
+
+# Server
+class RenderServer(object):
+    """
+    Accepts jobs from any number of local clients and runs them one at a
+    time on the thread that calls serve_forever() (Maya's main thread).
+
+    Parameters:
+        handler: Object with start(), run(job) -> dict, memory_mb(), recycle()
+            and `kinds`, the job kinds it runs once started.
+        host (str), port (int): Address to listen on, port 0 picks a free one.
+        max_queue (int): Jobs waiting beyond this are answered with "busy".
+        max_memory_mb (float): Worker memory that triggers a recycle, None disables it.
+    """
+    def __init__(self, handler, host=DEFAULT_HOST, port=DEFAULT_PORT, max_queue=16, max_memory_mb=None):
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.max_memory_mb = max_memory_mb
+        self.recycle_requested = False
+        self._jobs = queue.Queue(maxsize=max_queue)
+        self._listener = None
+        self._connections = set()
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        """
+        Bind, start accepting connections and load the handler.
+        Returns the bound port.
+        """
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self.host, self.port))
+        self._listener.listen(8)
+        self.port = self._listener.getsockname()[1]
+        self._running = True
+
+        self.handler.start()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        print("Render server listening on {}:{}".format(self.host, self.port))
+        return self.port
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                break
+            conn = _LineSocket(sock)
+            with self._lock:
+                self._connections.add(conn)
+            threading.Thread(target=self._read_loop, args=(conn,), daemon=True).start()
+
+    def _read_loop(self, conn):
+        try:
+            while True:
+                msg = conn.recv()
+                if msg is None:
+                    break
+                self._on_message(conn, msg)
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._lock:
+                self._connections.discard(conn)
+            conn.close()
+
+    def _on_message(self, conn, msg):
+        if msg.get("type") == "ping":
+            conn.send({"type": "pong", "kinds": list(self.handler.kinds)})
+            return
+        if msg.get("type") != "job":
+            return
+
+        job_id = msg.get("id")
+        if msg.get("kind") not in self.handler.kinds:
+            conn.send({"type": "error", "id": job_id, "kind": msg.get("kind"),
+                       "error": "Job kind not run by this server: {}".format(msg.get("kind"))})
+            return
+        try:
+            self._jobs.put_nowait((conn, msg))
+        except queue.Full:
+            conn.send({"type": "busy", "id": job_id})
+            return
+        conn.send({"type": "accepted", "id": job_id})
+
+    def process_pending(self, timeout=None):
+        """
+        Run one queued job. Returns False if none arrived within timeout.
+        """
+        try:
+            item = self._jobs.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        if item is None:
+            return False
+
+        conn, job = item
+        start = time.time()
+        try:
+            data = self.handler.run(job)
+            reply = {"type": "result", "id": job["id"], "kind": job["kind"], "data": data}
+        except Exception as e:
+            reply = {"type": "error", "id": job["id"], "kind": job["kind"], "error": str(e)}
+        memory = self.handler.memory_mb()
+        reply["stats"] = {"seconds": round(time.time() - start, 3), "memory_mb": memory}
+
+        # The client resends unfinished jobs after a reconnect
+        try:
+            conn.send(reply)
+        except OSError:
+            pass
+
+        if self.max_memory_mb is not None and memory is not None and memory > self.max_memory_mb:
+            self._recycle()
+        return True
+
+    def _recycle(self):
+        self.handler.recycle()
+        memory = self.handler.memory_mb()
+        if memory is not None and memory > self.max_memory_mb:
+            print("Worker memory {:.0f} MB over {} MB, recycling".format(memory, self.max_memory_mb))
+            self.recycle_requested = True
+            self.stop()
+
+    def serve_forever(self):
+        if not self._running:
+            self.start()
+        while self._running:
+            self.process_pending(timeout=0.5)
+
+    def stop(self):
+        self._running = False
+        if self._listener is not None:
+            # shutdown() wakes the blocked accept() so the port is released
+            try:
+                self._listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+        with self._lock:
+            connections = list(self._connections)
+        for conn in connections:
+            conn.close()
+        try:
+            self._jobs.put_nowait(None)
+        except queue.Full:
+            pass
+
+
+# Client
+class RenderClient(object):
+    """
+    Panel side of the protocol.
+
+    Jobs stay pending until their result arrives; after a lost connection
+    the client reconnects and resends them. At most max_in_flight jobs are
+    outstanding, submit() blocks beyond that, and "busy" answers are
+    resent with backoff.
+
+    Parameters:
+        host (str), port (int): Server address.
+        max_in_flight (int): Outstanding jobs before submit() blocks.
+        reconnect_delay (float): First delay between reconnect attempts.
+        max_reconnects (int): Attempts before pending jobs fail.
+        on_result (callable): Optional callable(msg) run on the reader thread.
+            Results are also put on the `results` queue.
+
+    After connecting, `kinds` holds the job kinds the server runs.
+    """
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, max_in_flight=8,
+                 reconnect_delay=0.25, max_reconnects=8, on_result=None):
+        self.host = host
+        self.port = port
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnects = max_reconnects
+        self.on_result = on_result
+        self.results = queue.Queue()
+
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._conn = None
+        self._closed = False
+        self._reader = None
+        self.kinds = ()
+
+    def connect(self):
+        self._conn = self._open()
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    def _open(self):
+        sock = socket.create_connection((self.host, self.port), timeout=5)
+        conn = _LineSocket(sock)
+        # Ask which job kinds this server runs before sending any job
+        try:
+            conn.send({"type": "ping"})
+            reply = conn.recv()
+        except (OSError, ValueError) as e:
+            conn.close()
+            raise ConnectionError("No answer from render server: {}".format(e))
+        if reply is None or reply.get("type") != "pong":
+            conn.close()
+            raise ConnectionError("No answer from render server")
+        self.kinds = tuple(reply.get("kinds", JOB_KINDS))
+        sock.settimeout(None)
+        return conn
+
+    def submit(self, kind, model, output=None, size=256, timeout=None):
+        """
+        Queue a job on the server. Returns the job id.
+        Raises TimeoutError if no slot frees up within timeout.
+        """
+        if self._conn is None:
+            raise ConnectionError("Not connected to render server")
+        if kind not in self.kinds:
+            raise ValueError("Render server does not run {} jobs".format(kind))
+        if not self._slots.acquire(timeout=timeout if timeout is not None else -1):
+            raise TimeoutError("Render server has too many jobs in flight")
+
+        job = {"type": "job", "id": uuid.uuid4().hex, "kind": kind,
+               "model": model, "output": output, "size": size}
+        with self._lock:
+            self._pending[job["id"]] = job
+        self._send(job)
+        return job["id"]
+
+    @property
+    def connected(self):
+        return self._conn is not None and not self._closed
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _send(self, msg):
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            conn.send(msg)
+        except OSError:
+            # The reader notices the broken socket, reconnects and resends
+            pass
+
+    def _read_loop(self):
+        while not self._closed:
+            try:
+                msg = self._conn.recv()
+            except (OSError, ValueError):
+                msg = None
+
+            if msg is not None:
+                self._on_message(msg)
+                continue
+            if self._closed:
+                break
+
+            # Connection lost
+            if not self._reconnect():
+                self._conn = None
+                self._fail_pending("Lost connection to render server")
+                break
+
+    def _reconnect(self):
+        delay = self.reconnect_delay
+        for _ in range(self.max_reconnects):
+            time.sleep(delay)
+            if self._closed:
+                return False
+            try:
+                self._conn = self._open()
+            except OSError:
+                delay = min(delay * 2, 5.0)
+                continue
+            with self._lock:
+                jobs = list(self._pending.values())
+            for job in jobs:
+                self._send(job)
+            print("Reconnected to render server, resent {} jobs".format(len(jobs)))
+            return True
+        return False
+
+    def _on_message(self, msg):
+        kind = msg.get("type")
+        if kind == "busy":
+            job_id = msg.get("id")
+            with self._lock:
+                job = self._pending.get(job_id)
+            if job is not None:
+                job["_retries"] = job.get("_retries", 0) + 1
+                delay = min(self.reconnect_delay * job["_retries"], 2.0)
+                threading.Timer(delay, self._resend, args=(job_id,)).start()
+            return
+        if kind not in ("result", "error"):
+            return
+
+        with self._lock:
+            job = self._pending.pop(msg.get("id"), None)
+        if job is None:
+            # Duplicate result of a job resent after reconnect
+            return
+        self._slots.release()
+        self._deliver(msg)
+
+    def _resend(self, job_id):
+        with self._lock:
+            job = self._pending.get(job_id)
+        if job is not None and not self._closed:
+            self._send(job)
+
+    def _fail_pending(self, error):
+        with self._lock:
+            jobs = list(self._pending.values())
+            self._pending.clear()
+        for job in jobs:
+            self._slots.release()
+            self._deliver({"type": "error", "id": job["id"], "kind": job["kind"], "error": error})
+
+    def _deliver(self, msg):
+        self.results.put(msg)
+        if self.on_result:
+            self.on_result(msg)
+
+    def close(self):
+        self._closed = True
+        if self._conn is not None:
+            self._conn.close()
+
+
+def serve(port=DEFAULT_PORT, fake=False, max_memory_mb=None):
+    """
+    Run a server in this process until interrupted (mayapy or a second
+    Maya session dedicated to rendering).
+    Returns RECYCLE_EXIT_CODE if the worker should be restarted.
+    """
+    if fake:
+        handler = FakeJobHandler()
+    else:
+        from .thumbnails import ImportBudget
+        handler = MayaJobHandler(budget=ImportBudget())
+    server = RenderServer(handler, port=port, max_memory_mb=max_memory_mb)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return RECYCLE_EXIT_CODE if server.recycle_requested else 0
+
+
+def supervise(args):
+    """
+    Keep restarting the server process while it asks to be recycled.
+    """
+    if __package__:
+        command = [sys.executable, "-m", __package__ + ".render_server"] + args
+    else:
+        command = [sys.executable, os.path.abspath(__file__)] + args
+
+    import subprocess
+    while True:
+        code = subprocess.call(command)
+        if code != RECYCLE_EXIT_CODE:
+            return code
+        print("Restarting render worker")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Asset nav panel render server")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--fake", action="store_true", help="fake rendering, no Maya needed")
+    parser.add_argument("--max-memory-mb", type=float, default=None, help="recycle the worker above this")
+    parser.add_argument("--supervise", action="store_true", help="restart the worker when it recycles")
+    args = parser.parse_args()
+
+    if args.supervise:
+        worker_args = [a for a in sys.argv[1:] if a != "--supervise"]
+        sys.exit(supervise(worker_args))
+    sys.exit(serve(port=args.port, fake=args.fake, max_memory_mb=args.max_memory_mb))
@@ -0,0 +1,179 @@
+import os
+import json
+import threading
+
+STAT_FIELDS = ("files", "broken", "meshes", "vertices", "polygons", "ngons")
+
+
+def asset_totals(report):
+    """
+    Reduce an analysis report to the counters summed per folder.
+    """
+    totals = dict.fromkeys(STAT_FIELDS, 0)
+    totals["files"] = 1
+    totals["broken"] = 1 if report["errors"] else 0
+    totals["meshes"] = len(report["meshes"])
+    for m in report["meshes"]:
+        totals["vertices"] += m["vertices"]
+        totals["polygons"] += m["polygons"]
+        totals["ngons"] += m["ngons"]
+    return totals
+
+
+def _norm(path):
+    return os.path.normpath(path)
+
+
+def ancestors(path):
+    """
+    Yield every folder above path, nearest first, up to the filesystem root.
+    """
+    folder = os.path.dirname(path)
+    while True:
+        yield folder
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            break
+        folder = parent
+
+
+class FolderRollups(object):
+    """
+    Aggregated statistics for every folder tree that contains analyzed assets.
+
+    Each asset's totals are added to all of its ancestor folders, so a
+    change to one file updates only that ancestor chain and a folder's
+    totals are a dictionary lookup.
+    """
+    def __init__(self):
+        self._assets = {}
+        self._folders = {}
+
+    def update_asset(self, path, report):
+        self._apply(_norm(path), asset_totals(report))
+
+    def remove_asset(self, path):
+        self._apply(_norm(path), None)
+
+    def _apply(self, path, totals):
+        old = self._assets.pop(path, None)
+        if totals is not None:
+            self._assets[path] = totals
+        if old is None and totals is None:
+            return
+
+        delta = {}
+        for field in STAT_FIELDS:
+            delta[field] = (totals[field] if totals else 0) - (old[field] if old else 0)
+
+        for folder in ancestors(path):
+            current = self._folders.setdefault(folder, dict.fromkeys(STAT_FIELDS, 0))
+            for field in STAT_FIELDS:
+                current[field] += delta[field]
+            # Drop folders that no longer hold analyzed assets
+            if current["files"] == 0:
+                del self._folders[folder]
+
+    def totals(self, folder):
+        """
+        Totals for everything analyzed below folder (zeros if nothing).
+        """
+        return dict(self._folders.get(_norm(folder), dict.fromkeys(STAT_FIELDS, 0)))
+
+    def asset(self, path):
+        return self._assets.get(_norm(path))
+
+
+class ReportCache(object):
+    """
+    Analysis reports stored per asset together with the file's size and
+    mtime, so stale reports are detected without re-importing.
+
+    The staleness checks stat files and may run on a worker thread, the
+    other methods are safe to call alongside them.
+
+    Parameters:
+        cache_path (str): json file the reports are kept in.
+    """
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def _stat(path):
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def put(self, path, report):
+        try:
+            entry = {"stat": self._stat(path), "report": report}
+        except OSError:
+            return
+        with self._lock:
+            self._entries[_norm(path)] = entry
+
+    def get(self, path):
+        """
+        Returns the cached report if the file is unchanged, otherwise None.
+        """
+        path = _norm(path)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None or not self._unchanged(path, entry):
+            return None
+        return entry["report"]
+
+    def _unchanged(self, path, entry):
+        try:
+            return self._stat(path) == entry["stat"]
+        except OSError:
+            return False
+
+    def stale_in(self, folder=None):
+        """
+        Cached assets directly inside folder (every cached asset if folder
+        is None) that changed or were deleted. Stale entries are dropped
+        from the cache.
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        if folder is not None:
+            folder = _norm(folder)
+            entries = [(p, e) for p, e in entries if os.path.dirname(p) == folder]
+
+        # Stat outside the lock, put() may replace an entry meanwhile
+        stale = []
+        for path, entry in entries:
+            if self._unchanged(path, entry):
+                continue
+            with self._lock:
+                if self._entries.get(path) is entry:
+                    del self._entries[path]
+                    stale.append(path)
+        return stale
+
+    def fill(self, rollups):
+        """
+        Add every cached report to rollups without touching the files,
+        stale_in() finds the reports that have to be removed again.
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        for path, entry in entries:
+            rollups.update_asset(path, entry["report"])
+
+    def load(self):
+        if not os.path.exists(self.cache_path):
+            return
+        with open(self.cache_path, "r") as f:
+            entries = json.load(f)
+        with self._lock:
+            self._entries = entries
+
+    def save(self):
+        with self._lock:
+            entries = dict(self._entries)
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        with open(self.cache_path, "w") as f:
+            json.dump(entries, f, indent=4)
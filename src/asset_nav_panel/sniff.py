@@ -0,0 +1,319 @@
+"""
+Fast metadata from file headers, without importing into Maya.
+
+Only the start of each file is read (MAX_READ_BYTES), so counts of
+truncated files are lower bounds. Pure Python, safe to call from a
+thread pool.
+"""
+import os
+import re
+import shlex
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_READ_BYTES = 4 * 1024 * 1024
+
+FBX_BINARY_MAGIC = b"Kaydara FBX Binary  \x00"
+USDC_MAGIC = b"PXR-USDC"
+FBX_UP_AXIS = {0: "x", 1: "y", 2: "z"}
+
+
+def _empty(path, fmt):
+    return {
+        "path": path,
+        "format": fmt,
+        "maya_version": None,
+        "up_axis": None,
+        "plugins": [],
+        "node_count": 0,
+        "mesh_count": 0,
+        "node_types": {},
+        "truncated": False,
+    }
+
+
+def _read_lines(path, max_bytes):
+    """
+    Yield decoded lines until max_bytes were read. The generator's
+    return value says whether the file was cut short.
+
+    Reads never go past the budget, also on single huge lines such as
+    USDA point arrays.
+    """
+    read = 0
+    with open(path, "rb") as f:
+        while True:
+            raw = f.readline(max_bytes - read + 1)
+            if not raw:
+                return False
+            read += len(raw)
+            if read > max_bytes:
+                return True
+            yield raw.decode("utf-8", "replace")
+
+
+def _count(meta, node_type):
+    meta["node_count"] += 1
+    meta["node_types"][node_type] = meta["node_types"].get(node_type, 0) + 1
+
+
+# Maya ASCII
+def _parse_requires(line):
+    """
+    'requires -nodeType "aiOptions" "mtoa" "5.2.1";' -> ("mtoa", "5.2.1")
+    """
+    try:
+        tokens = shlex.split(line.strip().rstrip(";"))[1:]
+    except ValueError:
+        return None, None
+    positional = []
+    skip = False
+    for token in tokens:
+        if skip:
+            skip = False
+        elif token.startswith("-"):
+            # every requires flag takes one argument
+            skip = True
+        else:
+            positional.append(token)
+    if not positional:
+        return None, None
+    return positional[0], positional[1] if len(positional) > 1 else None
+
+
+def sniff_maya_ascii(path, max_bytes=MAX_READ_BYTES, header_only=False):
+    """
+    Maya version, required plugins, up axis and createNode counts of a .ma file.
+
+    :param header_only: stop at the first createNode, enough for plugins
+    """
+    meta = _empty(path, "mayaAscii")
+    lines = _read_lines(path, max_bytes)
+    statement = ""
+    while True:
+        try:
+            line = next(lines)
+        except StopIteration as stop:
+            meta["truncated"] = bool(stop.value)
+            break
+
+        # Long requires / createNode statements wrap onto continuation
+        # lines, collect them up to the terminating ";"
+        if statement:
+            statement += " " + line.strip()
+            if not statement.endswith(";"):
+                continue
+            line, statement = statement, ""
+        elif line.startswith(("requires", "createNode")) and not line.rstrip().endswith(";"):
+            statement = line.strip()
+            continue
+
+        if line.startswith("//Maya ASCII"):
+            parts = line.split()
+            if len(parts) > 2:
+                meta["maya_version"] = parts[2]
+        elif line.startswith("requires"):
+            name, version = _parse_requires(line)
+            if name == "maya":
+                meta["maya_version"] = meta["maya_version"] or version
+            elif name and name not in meta["plugins"]:
+                meta["plugins"].append(name)
+        elif line.startswith("createNode"):
+            if header_only:
+                meta["truncated"] = True
+                break
+            parts = line.split()
+            if len(parts) > 1:
+                node_type = parts[1].rstrip(";")
+                _count(meta, node_type)
+                if node_type == "mesh":
+                    meta["mesh_count"] += 1
+        elif "upAxis" in line and meta["up_axis"] is None:
+            match = re.search(r'upAxis"?\s+"?([xyzXYZ])"?', line)
+            if match:
+                meta["up_axis"] = match.group(1).lower()
+    return meta
+
+
+# USD
+PRIM_RE = re.compile(r'^\s*(def|over|class)\s+(?:([A-Za-z_]\w*)\s+)?"([^"]*)"')
+UP_AXIS_RE = re.compile(r'upAxis\s*=\s*"([XYZ])"')
+
+
+def sniff_usd(path, max_bytes=MAX_READ_BYTES):
+    """
+    Prim counts and up axis of a USDA file. Binary crate files (usdc)
+    only report their format.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(8)
+    if magic == USDC_MAGIC:
+        return _empty(path, "usdc")
+
+    meta = _empty(path, "usda")
+    lines = _read_lines(path, max_bytes)
+    while True:
+        try:
+            line = next(lines)
+        except StopIteration as stop:
+            meta["truncated"] = bool(stop.value)
+            break
+
+        match = PRIM_RE.match(line)
+        if match:
+            prim_type = match.group(2) or match.group(1)
+            _count(meta, prim_type)
+            if prim_type == "Mesh":
+                meta["mesh_count"] += 1
+            continue
+        if meta["up_axis"] is None:
+            match = UP_AXIS_RE.search(line)
+            if match:
+                meta["up_axis"] = match.group(1).lower()
+    return meta
+
+
+# FBX
+def _fbx_property_value(data, name):
+    """
+    Value of a 'P' property record in binary FBX data: the name is followed
+    by three more strings (type, label, flags) and then the value.
+    """
+    start = data.find(name.encode("ascii"))
+    if start < 0:
+        return None
+    pos = start + len(name)
+    try:
+        for _ in range(3):
+            if data[pos:pos + 1] != b"S":
+                return None
+            length = struct.unpack("<I", data[pos + 1:pos + 5])[0]
+            pos += 5 + length
+        code = data[pos:pos + 1]
+        if code == b"I":
+            return struct.unpack("<i", data[pos + 1:pos + 5])[0]
+        if code == b"S":
+            length = struct.unpack("<I", data[pos + 1:pos + 5])[0]
+            return data[pos + 5:pos + 5 + length].decode("utf-8", "replace")
+    except struct.error:
+        return None
+    return None
+
+
+def sniff_fbx(path, max_bytes=MAX_READ_BYTES):
+    """
+    FBX version, up axis, application version and mesh count (binary or ASCII).
+    """
+    with open(path, "rb") as f:
+        data = f.read(max_bytes + 1)
+    truncated = len(data) > max_bytes
+    data = data[:max_bytes]
+
+    if data.startswith(FBX_BINARY_MAGIC):
+        meta = _empty(path, "fbx")
+        meta["fbx_version"] = struct.unpack("<I", data[23:27])[0]
+        axis = _fbx_property_value(data, "UpAxis")
+        meta["up_axis"] = FBX_UP_AXIS.get(axis)
+        # Geometry objects: name "x\x00\x01Geometry" followed by class "Mesh"
+        meta["mesh_count"] = len(re.findall(rb"\x00\x01GeometryS\x04\x00\x00\x00Mesh", data))
+        app = _fbx_property_value(data, "LastSaved|ApplicationName")
+        version = _fbx_property_value(data, "LastSaved|ApplicationVersion")
+    else:
+        meta = _empty(path, "fbxAscii")
+        text = data.decode("utf-8", "replace")
+        match = re.search(r"FBXVersion:\s*(\d+)", text)
+        meta["fbx_version"] = int(match.group(1)) if match else None
+        match = re.search(r'P:\s*"UpAxis",\s*"int",\s*"Integer",\s*"[^"]*",\s*(\d)', text)
+        meta["up_axis"] = FBX_UP_AXIS.get(int(match.group(1))) if match else None
+        meta["mesh_count"] = len(re.findall(r'Geometry:\s*\d+,\s*"Geometry::[^"]*",\s*"Mesh"', text))
+        match = re.search(r'"LastSaved\|ApplicationName",\s*"KString",\s*"[^"]*",\s*"[^"]*",\s*"([^"]*)"', text)
+        app = match.group(1) if match else None
+        match = re.search(r'"LastSaved\|ApplicationVersion",\s*"KString",\s*"[^"]*",\s*"[^"]*",\s*"([^"]*)"', text)
+        version = match.group(1) if match else None
+
+    if app and "maya" in app.lower():
+        meta["maya_version"] = version
+    meta["application"] = app
+    meta["node_count"] = meta["mesh_count"]
+    meta["truncated"] = truncated
+    return meta
+
+
+# OBJ
+def sniff_obj(path, max_bytes=MAX_READ_BYTES):
+    """
+    Vertex, face and object counts of an OBJ file.
+    """
+    meta = _empty(path, "obj")
+    meta["vertices"] = 0
+    meta["faces"] = 0
+    lines = _read_lines(path, max_bytes)
+    while True:
+        try:
+            line = next(lines)
+        except StopIteration as stop:
+            meta["truncated"] = bool(stop.value)
+            break
+        if line.startswith("v "):
+            meta["vertices"] += 1
+        elif line.startswith("f "):
+            meta["faces"] += 1
+        elif line.startswith(("o ", "g ")):
+            _count(meta, "object")
+    # An OBJ without object/group statements is still one mesh
+    meta["mesh_count"] = meta["node_count"] or (1 if meta["faces"] else 0)
+    return meta
+
+
+SNIFFERS = {
+    ".ma": sniff_maya_ascii,
+    ".usd": sniff_usd,
+    ".usda": sniff_usd,
+    ".fbx": sniff_fbx,
+    ".obj": sniff_obj,
+}
+
+
+def sniff_metadata(path, max_bytes=MAX_READ_BYTES):
+    """
+    Header metadata of a supported asset, or None for unknown formats.
+    """
+    sniffer = SNIFFERS.get(os.path.splitext(path)[1].lower())
+    if sniffer is None:
+        return None
+    return sniffer(path, max_bytes=max_bytes)
+
+
+def sniff_many(paths, max_workers=8, max_bytes=MAX_READ_BYTES):
+    """
+    Sniff files in a thread pool. Returns {path: metadata or None}.
+    """
+    def job(path):
+        try:
+            return sniff_metadata(path, max_bytes)
+        except OSError as e:
+            print("Sniff failed:", path, e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(paths, pool.map(job, paths)))
+
+
+def format_metadata(meta):
+    """
+    Short multi-line summary used for tooltips.
+    """
+    if not meta:
+        return ""
+    lines = ["Format: {}".format(meta["format"])]
+    if meta.get("maya_version"):
+        lines.append("Maya: {}".format(meta["maya_version"]))
+    if meta.get("up_axis"):
+        lines.append("Up axis: {}".format(meta["up_axis"].upper()))
+    more = "+" if meta["truncated"] else ""
+    if meta.get("faces") is not None:
+        lines.append("Verts: {:,}{} | Faces: {:,}{}".format(meta["vertices"], more, meta["faces"], more))
+    lines.append("Meshes: {}{} | Nodes: {}{}".format(meta["mesh_count"], more, meta["node_count"], more))
+    if meta["plugins"]:
+        lines.append("Plugins: {}".format(", ".join(meta["plugins"])))
+    return "\n".join(lines)
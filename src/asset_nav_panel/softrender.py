@@ -0,0 +1,311 @@
+"""
+Software thumbnails for OBJ assets, no Maya needed.
+
+Parses the OBJ, normalizes it to its bounding box and rasterizes the
+triangles into a z-buffer with NumPy, then writes a PNG. Thumbnails are
+rendered in a process pool across all cores, so the OBJ part of a
+library can be thumbnailed on any build machine:
+
+    python -m asset_nav_panel.softrender /path/to/assets [out_dir]
+
+The Maya playblast (thumbnails.save_thumbnail_png) stays the high
+quality option.
+"""
+import os
+import sys
+import math
+import zlib
+import struct
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import numpy as np
+except ImportError:  # optional, only needed to render
+    np = None
+
+BACKGROUND = (58, 58, 58)
+BASE_COLOR = (190, 190, 190)
+LIGHT_DIR = (0.4, 0.6, 0.7)
+# Pixel samples tested per rasterizer batch, bounds its memory use
+MAX_BATCH_SAMPLES = 1 << 22
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("Software thumbnails need numpy")
+
+
+def load_obj(path):
+    """
+    Vertices (N, 3) and fan-triangulated faces (M, 3) of an OBJ file.
+    """
+    _require_numpy()
+    vertices = []
+    triangles = []
+    with open(path, "r", errors="replace") as f:
+        for line in f:
+            if line.startswith("v "):
+                parts = line.split()
+                vertices.append((float(parts[1]), float(parts[2]), float(parts[3])))
+            elif line.startswith("f "):
+                # "f 1/1/1 2/2/2 3/3/3 4/4/4", negative indices are relative
+                face = []
+                for token in line.split()[1:]:
+                    index = int(token.split("/")[0])
+                    face.append(index - 1 if index > 0 else len(vertices) + index)
+                for i in range(1, len(face) - 1):
+                    triangles.append((face[0], face[i], face[i + 1]))
+
+    if not vertices or not triangles:
+        raise RuntimeError("No geometry found")
+    return np.array(vertices, dtype=np.float64), np.array(triangles, dtype=np.int64)
+
+
+def normalize(vertices):
+    """
+    Center on the bounding box and scale the longest side to 1.
+    """
+    low = vertices.min(axis=0)
+    high = vertices.max(axis=0)
+    extent = float((high - low).max()) or 1.0
+    return (vertices - (low + high) / 2.0) / extent
+
+
+def _rotation(yaw, pitch):
+    yaw = math.radians(yaw)
+    pitch = math.radians(pitch)
+    ry = np.array([
+        [math.cos(yaw), 0.0, math.sin(yaw)],
+        [0.0, 1.0, 0.0],
+        [-math.sin(yaw), 0.0, math.cos(yaw)],
+    ])
+    rx = np.array([
+        [1.0, 0.0, 0.0],
+        [0.0, math.cos(pitch), -math.sin(pitch)],
+        [0.0, math.sin(pitch), math.cos(pitch)],
+    ])
+    return rx.dot(ry)
+
+
+def _face_colors(view, triangles, shading):
+    v0, v1, v2 = (view[triangles[:, i]] for i in range(3))
+    normals = np.cross(v1 - v0, v2 - v0)
+    length = np.linalg.norm(normals, axis=1)
+    length[length == 0] = 1.0
+    normals /= length[:, None]
+    # Double sided: flip normals that face away from the camera
+    normals[normals[:, 2] < 0] *= -1
+
+    if shading == "normal":
+        return (normals * 0.5 + 0.5) * 255.0
+
+    light = np.array(LIGHT_DIR, dtype=np.float64)
+    light /= np.linalg.norm(light)
+    intensity = 0.25 + 0.75 * np.abs(normals.dot(light))
+    return intensity[:, None] * np.array(BASE_COLOR, dtype=np.float64)
+
+
+def _fragments(sx, sy, depth, triangles, res):
+    """
+    Pixel index, depth and triangle of every pixel center covered by a
+    triangle, computed for many triangles at once.
+
+    Triangles are bucketed by the power of two that fits their bounding
+    box, so each batch is one dense (triangles, side, side) grid. Batches
+    hold at most MAX_BATCH_SAMPLES samples.
+    """
+    x = sx[triangles]
+    y = sy[triangles]
+    z = depth[triangles]
+    area = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (x[:, 2] - x[:, 0]) * (y[:, 1] - y[:, 0])
+
+    xmin = np.maximum(np.floor(x.min(axis=1)), 0).astype(np.int64)
+    xmax = np.minimum(np.ceil(x.max(axis=1)), res - 1).astype(np.int64)
+    ymin = np.maximum(np.floor(y.min(axis=1)), 0).astype(np.int64)
+    ymax = np.minimum(np.ceil(y.max(axis=1)), res - 1).astype(np.int64)
+    keep = (area != 0) & (xmin <= xmax) & (ymin <= ymax)
+    span = np.maximum(xmax - xmin, ymax - ymin) + 1
+    bucket = np.ceil(np.log2(np.maximum(span, 1))).astype(np.int64)
+
+    pixels, depths, faces = [], [], []
+    for b in np.unique(bucket[keep]):
+        side = 1 << int(b)
+        ids = np.nonzero(keep & (bucket == b))[0]
+        step = max(1, MAX_BATCH_SAMPLES // (side * side))
+        offsets = np.arange(side)
+        for first in range(0, len(ids), step):
+            t = ids[first:first + step]
+            px = (xmin[t][:, None] + offsets)[:, None, :]
+            py = (ymin[t][:, None] + offsets)[:, :, None]
+            x0, x1, x2 = (x[t, i][:, None, None] for i in range(3))
+            y0, y1, y2 = (y[t, i][:, None, None] for i in range(3))
+            a = area[t][:, None, None]
+
+            # Barycentric weights at pixel centers
+            cx = px + 0.5
+            cy = py + 0.5
+            w0 = ((x1 - cx) * (y2 - cy) - (x2 - cx) * (y1 - cy)) / a
+            w1 = ((x2 - cx) * (y0 - cy) - (x0 - cx) * (y2 - cy)) / a
+            w2 = 1.0 - w0 - w1
+            inside = ((w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+                      & (px <= xmax[t][:, None, None]) & (py <= ymax[t][:, None, None]))
+
+            tt, yy, xx = np.nonzero(inside)
+            zz = w0 * z[t, 0][:, None, None] + w1 * z[t, 1][:, None, None] + w2 * z[t, 2][:, None, None]
+            pixels.append((ymin[t][tt] + yy) * res + xmin[t][tt] + xx)
+            depths.append(zz[inside])
+            faces.append(t[tt])
+
+    if not pixels:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, np.zeros(0), empty
+    return np.concatenate(pixels), np.concatenate(depths), np.concatenate(faces)
+
+
+def rasterize(vertices, triangles, size=256, shading="flat", yaw=35.0, pitch=-25.0, supersample=2):
+    """
+    Orthographic z-buffer render of a normalized mesh.
+
+    :param shading: "flat" (lambert per face) or "normal" (normal as color)
+    :return: (size, size, 3) uint8 RGB image
+    """
+    _require_numpy()
+    res = size * supersample
+    view = normalize(vertices).dot(_rotation(yaw, pitch).T)
+
+    # Fit the rotated bounding box into the image with a small margin
+    low = view[:, :2].min(axis=0)
+    high = view[:, :2].max(axis=0)
+    scale = 0.9 * res / (float((high - low).max()) or 1.0)
+    center = (low + high) / 2.0
+    sx = (view[:, 0] - center[0]) * scale + res / 2.0
+    sy = res / 2.0 - (view[:, 1] - center[1]) * scale
+    depth = view[:, 2]
+
+    colors = _face_colors(view, triangles, shading)
+    pixel, z, face = _fragments(sx, sy, depth, triangles, res)
+
+    # Nearest fragment per pixel: sort by pixel, then depth, and keep the
+    # last of each run; on equal depth the earlier triangle wins
+    order = np.lexsort((-face, z, pixel))
+    pixel = pixel[order]
+    face = face[order]
+    last = np.ones(len(pixel), dtype=bool)
+    last[:-1] = pixel[1:] != pixel[:-1]
+
+    image = np.empty((res * res, 3), dtype=np.float64)
+    image[:] = BACKGROUND
+    image[pixel[last]] = colors[face[last]]
+    image = image.reshape(res, res, 3)
+
+    # Average supersampled pixels down to the output size
+    image = image.reshape(size, supersample, size, supersample, 3).mean(axis=(1, 3))
+    return np.clip(image, 0, 255).astype(np.uint8)
+
+
+def write_png(png_path, image):
+    """
+    Write an (h, w, 3) uint8 RGB array as PNG without an imaging library.
+    """
+    height, width = image.shape[:2]
+    raw = b"".join(b"\x00" + image[y].tobytes() for y in range(height))
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    with open(png_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw, 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def render_obj_thumbnail(obj_path, png_path, size=256, shading="flat"):
+    """
+    Parse, rasterize and save one OBJ thumbnail. Runs in pool workers.
+    """
+    vertices, triangles = load_obj(obj_path)
+    write_png(png_path, rasterize(vertices, triangles, size=size, shading=shading))
+    return png_path
+
+
+def _process_context():
+    """
+    Spawn context whose workers run mayapy when called from inside Maya,
+    where sys.executable is the Maya GUI binary.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    exe = os.path.basename(sys.executable).lower()
+    if exe.startswith("maya") and not exe.startswith("mayapy"):
+        ext = ".exe" if exe.endswith(".exe") else ""
+        ctx.set_executable(os.path.join(os.path.dirname(sys.executable), "mayapy" + ext))
+    return ctx
+
+
+def submit_obj_thumbnails(jobs, max_workers=None, size=256, shading="flat"):
+    """
+    Start rendering in a process pool.
+
+    :param jobs: list of (obj_path, png_path)
+    :return: (executor, {future: obj_path}), shut the executor down when done
+    """
+    _require_numpy()
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_process_context())
+    futures = {
+        executor.submit(render_obj_thumbnail, obj_path, png_path, size, shading): obj_path
+        for obj_path, png_path in jobs
+    }
+    return executor, futures
+
+
+def render_obj_thumbnails(jobs, max_workers=None, size=256, shading="flat"):
+    """
+    Render thumbnails on all cores and wait for them.
+
+    :param jobs: list of (obj_path, png_path)
+    :return: {obj_path: error message or None}
+    """
+    executor, futures = submit_obj_thumbnails(jobs, max_workers, size, shading)
+    results = {}
+    try:
+        for future in as_completed(futures):
+            error = future.exception()
+            results[futures[future]] = str(error) if error else None
+    finally:
+        executor.shutdown()
+    return results
+
+
+def main(argv=None):
+    import argparse
+    from .utils import flat_thumbnail_name, THUMBNAIL_DIR
+
+    parser = argparse.ArgumentParser(description="Software OBJ thumbnails")
+    parser.add_argument("folder")
+    parser.add_argument("out_dir", nargs="?", default=THUMBNAIL_DIR)
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--shading", choices=("flat", "normal"), default="flat")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    jobs = []
+    # Absolute paths give the same thumbnail names the panel looks up
+    for root, _, files in os.walk(os.path.abspath(args.folder)):
+        for name in files:
+            if name.lower().endswith(".obj"):
+                obj_path = os.path.join(root, name)
+                jobs.append((obj_path, os.path.join(args.out_dir, flat_thumbnail_name(obj_path))))
+
+    results = render_obj_thumbnails(jobs, args.workers, args.size, args.shading)
+    failed = {k: v for k, v in results.items() if v}
+    for path, error in failed.items():
+        print("Thumbnail failed:", path, error)
+    print("Rendered {} / {} thumbnails".format(len(results) - len(failed), len(results)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,39 +1,215 @@
 import maya.cmds as cmds
 import os
 
-def save_thumbnail_png(model_path, png_path, size=256):
+from .sniff import sniff_maya_ascii
+
+
+# Importer plugin needed per extension
+IMPORT_PLUGINS = {
+    ".fbx": "fbxmaya",
+    ".obj": "objExport",
+    ".usd": "mayaUsdPlugin",
+}
+
+# File translator passed to cmds.file so Maya does not have to guess
+IMPORT_TYPES = {
+    ".fbx": "FBX",
+    ".obj": "OBJ",
+    ".ma": "mayaAscii",
+    ".usd": "USD Import",
+}
+
+
+def load_plugin(plugin):
     """
-    Import a model and save a single PNG thumbnail.
+    Load a plugin unless it already is. Returns False if it is not available.
+    """
+    try:
+        if not cmds.pluginInfo(plugin, q=True, loaded=True):
+            cmds.loadPlugin(plugin, quiet=True)
+        return bool(cmds.pluginInfo(plugin, q=True, loaded=True))
+    except Exception:
+        return False
 
-    :param model_path: path to .obj / .fbx / .ma
-    :param png_path: output .png path
-    :param size: width/height of thumbnail
+
+def ensure_import_plugin(model_path):
+    """
+    Load the importer plugin for the model's extension once.
+    Already loaded plugins are skipped, so batches do not pay for it per file.
+    """
+    ext = os.path.splitext(model_path)[1].lower()
+    plugin = IMPORT_PLUGINS.get(ext)
+    if plugin:
+        load_plugin(plugin)
+
+
+class AssetTooLargeError(RuntimeError):
+    pass
+
+
+class MissingPluginError(RuntimeError):
+    pass
+
+
+def check_required_plugins(model_path):
+    """
+    Read the 'requires' lines of a Maya ASCII file and raise
+    MissingPluginError before importing if any plugin can not be loaded.
+    """
+    if os.path.splitext(model_path)[1].lower() != ".ma":
+        return
+    meta = sniff_maya_ascii(model_path, header_only=True)
+    missing = [p for p in meta["plugins"] if not load_plugin(p)]
+    if missing:
+        raise MissingPluginError("Missing plugins: {}".format(", ".join(missing)))
+
+
+def translator_flags(model_path):
+    """
+    cmds.file flags selecting the translator for the extension.
+    """
+    file_type = IMPORT_TYPES.get(os.path.splitext(model_path)[1].lower())
+    return {"type": file_type} if file_type else {}
+
+
+def import_file(model_path):
+    """
+    Import with the translator matching the extension.
+    """
+    return cmds.file(model_path, i=True, ignoreVersion=True, **translator_flags(model_path))
+
+
+class ImportBudget(object):
+    """
+    Per-asset limits for preview imports.
+
+    Parameters:
+        max_file_mb (float): Files above this size are never imported.
+        max_polygons (int): Imported scenes above this are reduced.
+        policy (str): What to do with an oversized asset:
+            "skip"      raise AssetTooLargeError, no thumbnail
+            "proxy"     bounding boxes instead of the geometry
+            "decimate"  polyReduce down to max_polygons
+            Files over max_file_mb cannot be decimated without importing
+            them, so "decimate" falls back to a placeholder for those.
+    """
+    POLICIES = ("skip", "proxy", "decimate")
+
+    def __init__(self, max_file_mb=1024, max_polygons=2000000, policy="proxy"):
+        if policy not in self.POLICIES:
+            raise ValueError("Unknown budget policy: {}".format(policy))
+        self.max_file_mb = max_file_mb
+        self.max_polygons = max_polygons
+        self.policy = policy
+
+
+def import_for_preview(model_path, budget=None, require_plugins=True):
     """
+    Import a model into a new scene within the budget.
 
-    # New clean scene 
+    :param model_path: path to .obj / .fbx / .ma
+    :param budget: ImportBudget, None imports everything
+    :param require_plugins: skip .ma files whose required plugins are missing
+    :return: dict with "mode" (full / proxy / decimated / placeholder)
+        and "polygons" before any reduction
+    """
     cmds.file(new=True, force=True)
+    ensure_import_plugin(model_path)
+    if require_plugins:
+        check_required_plugins(model_path)
 
-    ext = os.path.splitext(model_path)[1].lower()
-    if ext == ".fbx":
-        try:
-            cmds.loadPlugin("fbxmaya", quiet=True)
-        except Exception:
-            pass
+    if budget is not None:
+        size_mb = os.path.getsize(model_path) / (1024.0 * 1024.0)
+        if size_mb > budget.max_file_mb:
+            if budget.policy == "skip":
+                raise AssetTooLargeError("File is {:.0f} MB, budget is {} MB".format(size_mb, budget.max_file_mb))
+            # Stand-in so the thumbnail shows the asset was not loaded
+            cmds.polyCube(name="oversized_placeholder")
+            return {"mode": "placeholder", "polygons": None}
+
+    # Import without recording undo, the scene is thrown away afterwards
+    undo_state = cmds.undoInfo(q=True, state=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        import_file(model_path)
+    finally:
+        cmds.undoInfo(stateWithoutFlush=undo_state)
+
+    transforms = mesh_transforms()
+    polygons = sum(cmds.polyEvaluate(t, face=True) for t in transforms)
+    info = {"mode": "full", "polygons": polygons}
+
+    if budget is None or polygons <= budget.max_polygons:
+        return info
 
-    # Import model
-    cmds.file(model_path, i=True, ignoreVersion=True)
+    if budget.policy == "skip":
+        raise AssetTooLargeError("{} polygons, budget is {}".format(polygons, budget.max_polygons))
+    if budget.policy == "proxy":
+        cmds.geomToBBox(transforms, keepOriginal=False)
+        info["mode"] = "proxy"
+    else:
+        percentage = 100.0 * (1.0 - float(budget.max_polygons) / polygons)
+        for t in transforms:
+            cmds.polyReduce(t, percentage=percentage, replaceOriginal=True, constructionHistory=False)
+        info["mode"] = "decimated"
+    return info
 
-    # Get geometry
-    meshes = cmds.ls(type="mesh")
+
+def mesh_transforms():
+    meshes = cmds.ls(type="mesh", noIntermediate=True, long=True)
     if not meshes:
         raise RuntimeError("No geometry found")
+    return sorted(set(cmds.listRelatives(meshes, parent=True, fullPath=True)))
 
-    transform = cmds.listRelatives(meshes[0], parent=True)[0]
 
-    # Frame object
-    cmds.select(transform)
+def frame_all():
+    """
+    Frame the bounding box of every mesh, not just the first one.
+    """
+    cmds.select(mesh_transforms())
     cmds.viewFit()
 
+
+def session_memory_mb():
+    """
+    Memory used by this Maya session in MB, None if it can not be read.
+    """
+    try:
+        value = cmds.memory(heapMemory=True, megaByte=True)
+        if isinstance(value, (list, tuple)):
+            value = value[0]
+        return float(value)
+    except Exception:
+        return None
+
+
+def release_scene_memory():
+    """
+    Drop the current scene, undo queue and caches between assets.
+    """
+    cmds.file(new=True, force=True)
+    cmds.flushUndo()
+    try:
+        cmds.clearCache(all=True)
+    except Exception:
+        pass
+
+
+def save_thumbnail_png(model_path, png_path, size=256, budget=None):
+    """
+    Import a model and save a single PNG thumbnail.
+
+    :param model_path: path to .obj / .fbx / .ma
+    :param png_path: output .png path
+    :param size: width/height of thumbnail
+    :param budget: optional ImportBudget for oversized assets
+    :return: import info from import_for_preview
+    """
+    info = import_for_preview(model_path, budget)
+
+    # Frame the whole asset
+    frame_all()
+
     # Find a model panel
     panel = cmds.getPanel(type="modelPanel")[0]
     cmds.modelEditor(panel, e=True, grid=False)
@@ -50,9 +226,61 @@ def save_thumbnail_png(model_path, png_path, size=256):
         forceOverwrite=True
     )    
     print("Saved thumbnail:", png_path)
+    return info
 
 
 
+def scene_triangles():
+    """
+    World space points (N, 3) and triangles (M, 3) of every mesh in the
+    scene, read through the API so it also works without a viewport.
+    """
+    import numpy as np
+    import maya.api.OpenMaya as om
+
+    meshes = cmds.ls(type="mesh", noIntermediate=True, long=True)
+    if not meshes:
+        raise RuntimeError("No geometry found")
+
+    selection = om.MSelectionList()
+    for mesh in meshes:
+        selection.add(mesh)
+
+    points = []
+    triangles = []
+    offset = 0
+    for i in range(selection.length()):
+        fn = om.MFnMesh(selection.getDagPath(i))
+        mesh_points = fn.getPoints(om.MSpace.kWorld)
+        _, vertex_ids = fn.getTriangles()
+        points.extend((p.x, p.y, p.z) for p in mesh_points)
+        triangles.extend(offset + v for v in vertex_ids)
+        offset += len(mesh_points)
+    return np.array(points, dtype=np.float64), np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def save_thumbnail_software(model_path, png_path, size=256, budget=None):
+    """
+    Thumbnail without a model panel, for mayapy / batch sessions.
+
+    OBJ files are rendered straight from the file, other formats are
+    imported within the budget and their meshes rasterized.
+
+    :return: import info, mode "software" for OBJ files
+    """
+    from .softrender import rasterize, render_obj_thumbnail, write_png
+
+    if model_path.lower().endswith(".obj"):
+        render_obj_thumbnail(model_path, png_path, size=size)
+        info = {"mode": "software", "polygons": None}
+    else:
+        info = import_for_preview(model_path, budget)
+        vertices, triangles = scene_triangles()
+        write_png(png_path, rasterize(vertices, triangles, size=size))
+    print("Saved thumbnail:", png_path)
+    return info
+
+
 def playblast_movie(movie_path, size=256, start=1, end=24):
     cmds.playblast(
         filename=movie_path,
@@ -73,7 +301,8 @@ def save_gif_thumbnail(
     model_path,
     gif_path,
     size= 800,
-    frames=24
+    frames=24,
+    budget=None
 ):
     """
     Import a model and save a single GIF thumbnail.
@@ -82,19 +311,20 @@ def save_gif_thumbnail(
     :param gif_path: output .png path
     :param size: width/height of thumbnail
     :param frames: frames of  thr gif
+    :param budget: optional ImportBudget for oversized assets
+    :return: import info from import_for_preview
     """
     temp_movie = gif_path
-    cmds.file(new=True, force=True)
-    cmds.file(model_path, i=True, ignoreVersion=True)
+    info = import_for_preview(model_path, budget)
 
-    meshes = cmds.ls(type="mesh")
-    if not meshes:
-        raise RuntimeError("No geometry found")
+    # Group every imported root so the whole asset turns together
+    roots = [
+        a for a in cmds.ls(assemblies=True, long=True)
+        if not cmds.listRelatives(a, shapes=True, type="camera")
+    ]
+    transform = cmds.group(roots, name="turntable_grp")
 
-    transform = cmds.listRelatives(meshes[0], parent=True)[0]
-
-    cmds.select(transform)
-    cmds.viewFit()
+    frame_all()
 
     # Turntable
     cmds.currentTime(1)
@@ -104,4 +334,5 @@ def save_gif_thumbnail(
     cmds.select(clear=True)
     # Movie
     playblast_movie(temp_movie, size, 1, frames)
+    return info
 
@@ -0,0 +1,118 @@
+# tests/test_analyze_panel.py
+import time
+import random
+import importlib.util
+
+import pytest
+
+if importlib.util.find_spec("PySide6") is None and importlib.util.find_spec("PySide2") is None:
+    pytest.skip("needs PySide6 or PySide2", allow_module_level=True)
+
+from asset_nav_panel.analyze_panel import (
+    report_rows, AnalysisTableModel, AnalysisFilterProxy, COLUMNS, QtCore,
+)
+
+REPORT = {
+    "model": "/lib/hero.ma",
+    "meshes": [
+        {"mesh": "bodyShape", "vertices": 120, "polygons": 100, "ngons": 0, "uv_sets": ["map1"]},
+        {"mesh": "capeShape", "vertices": 40, "polygons": 30, "ngons": 4, "uv_sets": ["map1", "uv2"]},
+    ],
+    "errors": [],
+}
+BROKEN = {"model": "/lib/broken.fbx", "meshes": [], "errors": ["Import failed", "No geometry found"]}
+
+
+def _proxy():
+    model = AnalysisTableModel()
+    model.append_rows(report_rows(REPORT))
+    model.append_rows(report_rows(BROKEN))
+    proxy = AnalysisFilterProxy()
+    proxy.setSourceModel(model)
+    return model, proxy
+
+
+def test_report_rows_one_row_per_mesh_plus_errors():
+    rows = report_rows(REPORT) + report_rows(BROKEN)
+    assert all(len(row) == len(COLUMNS) for row in rows)
+    assert rows[0][:6] == ["/lib/hero.ma", "bodyShape", 120, 100, 0, "map1"]
+    assert rows[1][5] == "map1, uv2"
+    assert rows[2] == ["/lib/broken.fbx", "", None, None, None, "",
+                       "Import failed; No geometry found", ""]
+
+
+def test_report_rows_mark_reused_reports():
+    rows = report_rows(REPORT, "/lib/copy/hero.ma", same_as="/lib/hero.ma")
+    assert [row[0] for row in rows] == ["/lib/copy/hero.ma"] * 2
+    assert [row[-1] for row in rows] == ["/lib/hero.ma"] * 2
+
+
+def test_model_sorts_raw_values_missing_numbers_first():
+    model, proxy = _proxy()
+    assert model.rowCount() == 3
+    assert model.columnCount() == len(COLUMNS)
+    assert model.data(model.index(2, 3)) == ""
+
+    proxy.sort(3, QtCore.Qt.AscendingOrder)
+    assert [row[1] for row in proxy.visible_rows()] == ["", "capeShape", "bodyShape"]
+    proxy.sort(3, QtCore.Qt.DescendingOrder)
+    assert [row[1] for row in proxy.visible_rows()] == ["bodyShape", "capeShape", ""]
+
+    # Rows appended later join the sort on resort()
+    model.append_rows(report_rows({"model": "/lib/big.ma", "errors": [], "meshes": [
+        {"mesh": "bigShape", "vertices": 900, "polygons": 800, "ngons": 0, "uv_sets": []}]}))
+    model.resort()
+    assert proxy.visible_rows()[0][1] == "bigShape"
+
+
+def test_text_filter_matches_file_or_mesh():
+    _, proxy = _proxy()
+    proxy.set_text_filter("CAPE")
+    assert [row[1] for row in proxy.visible_rows()] == ["capeShape"]
+    proxy.set_text_filter("broken")
+    assert proxy.rowCount() == 1
+
+
+def test_range_filter_zero_is_a_real_bound():
+    _, proxy = _proxy()
+    # Clean meshes only: ngons max 0
+    proxy.set_range_filter(4, None, 0)
+    assert [row[1] for row in proxy.visible_rows()] == ["bodyShape"]
+    proxy.set_range_filter(3, 50, None)
+    assert [row[1] for row in proxy.visible_rows()] == ["bodyShape"]
+
+
+def test_range_column_without_bounds_keeps_error_rows():
+    _, proxy = _proxy()
+    proxy.set_range_filter(3, None, None)
+    assert proxy.rowCount() == 3
+
+
+def test_sort_and_filter_reset_stay_fast_at_100k_rows():
+    random.seed(0)
+    model = AnalysisTableModel()
+    model.append_rows([
+        ["/lib/f{}.ma".format(i // 5), "mesh{}Shape".format(i), random.randint(0, 10 ** 5),
+         random.randint(0, 10 ** 5), random.randint(0, 20), "map1", "", ""]
+        for i in range(100000)
+    ])
+    proxy = AnalysisFilterProxy()
+    proxy.setSourceModel(model)
+    assert proxy.rowCount() == 100000
+
+    start = time.time()
+    proxy.sort(3, QtCore.Qt.DescendingOrder)
+    sort_seconds = time.time() - start
+    polys = [model.row(r)[3] for r in range(1000)]
+    assert polys == sorted(polys, reverse=True)
+
+    proxy.set_text_filter("f1")
+    proxy.rowCount()
+    start = time.time()
+    proxy.set_text_filter("")
+    assert proxy.rowCount() == 100000
+    reset_seconds = time.time() - start
+
+    # Sorting through data() took tens of seconds here
+    assert sort_seconds < 5
+    assert reset_seconds < 5
@@ -0,0 +1,133 @@
+# tests/test_hashing.py
+import os
+
+from asset_nav_panel.hashing import ContentHashIndex, sampled_hash, full_hash
+
+
+def _write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def test_identical_files_in_different_folders_share_key(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    data = os.urandom(500 * 1024)
+    p1 = _write(tmp_path / "a" / "model.obj", data)
+    p2 = _write(tmp_path / "b" / "copy.obj", data)
+
+    index = ContentHashIndex()
+    assert index.key_for(p1) == index.key_for(p2)
+    assert list(index.duplicates().values()) == [[p1, p2]]
+
+
+def test_sampled_collision_is_confirmed_by_full_hash(tmp_path):
+    # Same size, head, middle and tail: only the full hash tells them apart
+    size = 512 * 1024
+    data = bytearray(size)
+    p1 = _write(tmp_path / "one.obj", bytes(data))
+    data[100 * 1024] = 1
+    p2 = _write(tmp_path / "two.obj", bytes(data))
+
+    assert sampled_hash(p1) == sampled_hash(p2)
+    assert full_hash(p1) != full_hash(p2)
+
+    index = ContentHashIndex()
+    assert index.key_for(p1) != index.key_for(p2)
+
+
+def test_cached_key_is_invalidated_by_edit(tmp_path):
+    p = _write(tmp_path / "model.obj", b"v 0 0 0\n")
+    index = ContentHashIndex()
+    assert index.cached_key(p) is None
+    key = index.key_for(p)
+    assert index.cached_key(p) == key
+
+    _write(tmp_path / "model.obj", b"v 1 1 1\nv 2 2 2\n")
+    assert index.cached_key(p) is None
+
+
+def test_index_round_trip(tmp_path):
+    p = _write(tmp_path / "model.obj", b"v 0 0 0\n")
+    index_path = str(tmp_path / "content_index.json")
+
+    index = ContentHashIndex(index_path)
+    key = index.key_for(p)
+    index.save()
+
+    loaded = ContentHashIndex(index_path)
+    loaded.load()
+    assert loaded.cached_key(p) == key
+
+
+def test_submit_hashes_in_background(tmp_path):
+    paths = [_write(tmp_path / "{}.obj".format(i), b"same") for i in range(4)]
+    index = ContentHashIndex(max_workers=2)
+    seen = []
+    futures = index.submit(paths, callback=lambda p, k: seen.append(p))
+    keys = {f.result() for f in futures}
+    index.shutdown(wait=True)
+    assert len(keys) == 1
+    assert sorted(seen) == sorted(paths)
+
+
+def test_file_edited_in_place_does_not_hand_out_its_old_key(tmp_path):
+    # The edit keeps size, head, middle and tail, so the sampled hash is unchanged
+    size = 512 * 1024
+    data = bytearray(size)
+    p = _write(tmp_path / "model.obj", bytes(data))
+    index = ContentHashIndex()
+    old_key = index.key_for(p)
+
+    data[100 * 1024] = 1
+    _write(tmp_path / "model.obj", bytes(data))
+    os.utime(p, ns=(1, 1))
+    copy = _write(tmp_path / "copy.obj", bytes(data))
+
+    assert index.key_for(copy) != old_key
+    assert index.key_for(p) == index.key_for(copy)
+    assert len(index._memo) == 2
+
+
+def test_load_prunes_changed_files(tmp_path):
+    data = bytearray(512 * 1024)
+    p = _write(tmp_path / "model.obj", bytes(data))
+    index_path = str(tmp_path / "content_index.json")
+    index = ContentHashIndex(index_path)
+    old_key = index.key_for(p)
+    index.save()
+
+    # Edited between sessions, same sampled hash
+    data[100 * 1024] = 1
+    _write(tmp_path / "model.obj", bytes(data))
+    os.utime(p, ns=(1, 1))
+
+    loaded = ContentHashIndex(index_path)
+    loaded.load()
+    assert loaded.cached_key(p) is None
+    assert loaded._memo == {}
+    assert loaded.key_for(p) != old_key
+
+
+def test_full_hashes_are_read_outside_the_lock(tmp_path, monkeypatch):
+    import asset_nav_panel.hashing as hashing
+
+    data = bytearray(512 * 1024)
+    p1 = _write(tmp_path / "one.obj", bytes(data))
+    data[100 * 1024] = 1
+    p2 = _write(tmp_path / "two.obj", bytes(data))
+
+    index = ContentHashIndex()
+    index.key_for(p1)
+    held = []
+    real_full_hash = hashing.full_hash
+
+    def checking_full_hash(path, *args):
+        # RLock._is_owned is private but reliable for this check
+        held.append(index._lock._is_owned())
+        return real_full_hash(path, *args)
+
+    monkeypatch.setattr(hashing, "full_hash", checking_full_hash)
+    index.key_for(p2)
+    assert held == [False, False]
@@ -0,0 +1,147 @@
+# tests/test_importer.py
+import os
+import sys
+import types
+import importlib
+
+import pytest
+
+
+class FakeCmds(types.ModuleType):
+    """
+    Records the maya.cmds calls the importer makes.
+    """
+    def __init__(self, namespaces=()):
+        super().__init__("maya.cmds")
+        self.namespaces = set(namespaces)
+        self.calls = []
+        self.selection = None
+
+    def namespace(self, exists=None):
+        return exists.lstrip(":") in self.namespaces
+
+    def pluginInfo(self, plugin, q=True, loaded=True):
+        return True
+
+    def loadPlugin(self, plugin, quiet=True):
+        pass
+
+    def file(self, path, namespace=None, **flags):
+        self.calls.append(("file", path, namespace, flags))
+        if not os.path.isfile(path):
+            raise RuntimeError("File not found: {}".format(path))
+        self.namespaces.add(namespace)
+        # A root transform plus its shape, like returnNewNodes
+        return ["|{}:root".format(namespace), "|{}:root|{}:rootShape".format(namespace, namespace)]
+
+    def undoInfo(self, **flags):
+        self.calls.append(("undoInfo", flags))
+
+    def refresh(self, **flags):
+        self.calls.append(("refresh", flags))
+
+    def ls(self, nodes, assemblies=False, long=True):
+        return [n for n in nodes if n.count("|") == 1]
+
+    def select(self, nodes, replace=True):
+        self.selection = list(nodes)
+
+
+@pytest.fixture
+def importer(monkeypatch):
+    cmds = FakeCmds()
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+    monkeypatch.setitem(sys.modules, "maya", maya)
+    monkeypatch.setitem(sys.modules, "maya.cmds", cmds)
+
+    module = importlib.import_module("asset_nav_panel.importer")
+    thumbnails = importlib.import_module("asset_nav_panel.thumbnails")
+    monkeypatch.setattr(module, "cmds", cmds)
+    monkeypatch.setattr(thumbnails, "cmds", cmds)
+    return module, cmds
+
+
+def _asset(tmp_path, name, size=16):
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_namespace_is_sanitized_and_unique(importer):
+    module, cmds = importer
+    assert module.asset_namespace("/lib/hero.obj") == "hero"
+    assert module.asset_namespace("/lib/my hero-v2.fbx") == "my_hero_v2"
+    assert module.asset_namespace("/lib/01_tree.ma") == "asset_01_tree"
+
+    cmds.namespaces.update(["hero", "hero1"])
+    assert module.asset_namespace("/lib/hero.obj") == "hero2"
+
+
+def test_auto_mode_uses_proxy_for_large_files(importer, tmp_path):
+    module, _ = importer
+    small = _asset(tmp_path, "small.obj", size=1024)
+    assert module.choose_mode(small) == "import"
+    assert module.choose_mode(small, large_file_mb=0.0001) == "proxy"
+    assert module.choose_mode(small, mode="reference") == "reference"
+
+
+def test_batch_imports_into_namespaces_and_selects_new_roots(importer, tmp_path):
+    module, cmds = importer
+    queue = module.BatchImportQueue(mode="import")
+    hero = _asset(tmp_path, "hero.obj")
+    queue.add(hero)
+    queue.add(hero)
+    queue.add(_asset(tmp_path, "prop.fbx"))
+    assert len(queue) == 2
+
+    results = queue.run()
+
+    assert [r["namespace"] for r in results] == ["hero", "prop"]
+    assert all(r["error"] is None for r in results)
+    assert cmds.selection == ["|hero:root", "|prop:root"]
+    # One undo chunk, refresh resumed afterwards
+    assert cmds.calls[0] == ("undoInfo", {"openChunk": True, "chunkName": "Batch import"})
+    assert cmds.calls[-2:] == [("refresh", {"suspend": False}), ("undoInfo", {"closeChunk": True})]
+    assert len(queue) == 0
+
+
+def test_proxy_mode_creates_deferred_references(importer, tmp_path):
+    module, cmds = importer
+    module.import_asset(_asset(tmp_path, "hero.obj"), mode="proxy")
+    _, _, namespace, flags = cmds.calls[-1]
+    assert namespace == "hero"
+    assert flags["reference"] and flags["deferReference"] and flags["returnNewNodes"]
+
+
+def test_progress_returning_false_cancels_the_rest(importer, tmp_path):
+    module, cmds = importer
+    queue = module.BatchImportQueue(mode="import")
+    for name in ("a.obj", "b.obj", "c.obj"):
+        queue.add(_asset(tmp_path, name))
+
+    seen = []
+
+    def progress(done, total, result):
+        seen.append((done, total))
+        return False
+
+    results = queue.run(progress)
+
+    assert seen == [(1, 3)]
+    assert [r["namespace"] for r in results] == ["a"]
+    assert cmds.selection == ["|a:root"]
+    assert cmds.calls[-1] == ("undoInfo", {"closeChunk": True})
+
+
+def test_missing_file_is_reported_not_raised(importer, tmp_path):
+    module, _ = importer
+    queue = module.BatchImportQueue(mode="auto")
+    queue.add(str(tmp_path / "missing.obj"))
+    queue.add(_asset(tmp_path, "hero.obj"))
+
+    results = queue.run()
+    assert [r["mode"] for r in results] == ["import", "import"]
+    assert "File not found" in results[0]["error"]
+    assert results[1]["namespace"] == "hero"
+    assert "ERROR" in queue.summary()
@@ -0,0 +1,122 @@
+# tests/test_prefetch.py
+import os
+
+from asset_nav_panel.prefetch import Prefetcher, ThumbnailCache
+
+EXT = [".obj"]
+
+
+def _library(tmp_path):
+    """
+    lib/a, lib/b, lib/c, lib/d with one asset and one 100 byte thumbnail each.
+    """
+    thumbs = tmp_path / "thumbs"
+    thumbs.mkdir()
+    lib = tmp_path / "lib"
+    for name in "abcd":
+        folder = lib / name
+        folder.mkdir(parents=True)
+        (folder / (name + ".obj")).write_text("v 0 0 0\n")
+        (thumbs / (name + ".obj")).write_bytes(b"x" * 100)
+    return lib, thumbs
+
+
+def _prefetcher(thumbs, **kwargs):
+    decoded = []
+
+    def decode(path):
+        decoded.append(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        return data, len(data)
+
+    def thumbnail_path(asset):
+        return os.path.join(str(thumbs), os.path.basename(asset))
+
+    return Prefetcher(EXT, thumbnail_path, decode, **kwargs), decoded
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ThumbnailCache(max_bytes=250)
+    cache.put("a", 1, 100)
+    cache.put("b", 2, 100)
+    cache.get("a")
+    cache.put("c", 3, 100)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.used_bytes == 200
+
+
+def test_neighbours_are_children_then_nearest_siblings(tmp_path):
+    lib, _ = _library(tmp_path)
+    (lib / "c" / "sub").mkdir()
+    order = Prefetcher.neighbours(str(lib / "c"))
+    assert order == [str(lib / "c" / "sub"), str(lib / "b"), str(lib / "d"), str(lib / "a")]
+
+
+def test_pass_warms_neighbours_and_reports_hits(tmp_path):
+    lib, thumbs = _library(tmp_path)
+    prefetcher, decoded = _prefetcher(thumbs)
+    prefetcher.prefetch_around(str(lib / "b")).result(timeout=5)
+
+    # Navigating to a sibling is served from memory
+    paths = prefetcher.listing(str(lib / "c"))
+    assert paths == [str(lib / "c" / "c.obj")]
+    assert prefetcher.thumbnail(os.path.join(str(thumbs), "c.obj")) == b"x" * 100
+    # The current folder itself was not prefetched
+    prefetcher.listing(str(lib / "b"))
+
+    stats = prefetcher.stats()
+    prefetcher.shutdown()
+    assert stats["listing_hits"] == 1
+    assert stats["listing_misses"] == 1
+    assert stats["thumbnail_hit_rate"] == 1.0
+    assert stats["prefetched_thumbnails"] == 3
+    assert len(decoded) == 3
+
+
+def test_read_budget_limits_a_pass(tmp_path):
+    lib, thumbs = _library(tmp_path)
+    prefetcher, decoded = _prefetcher(thumbs, max_read_bytes=150)
+    prefetcher.prefetch_around(str(lib / "a")).result(timeout=5)
+    prefetcher.shutdown()
+    assert len(decoded) == 1
+
+
+def test_cancelled_pass_stops(tmp_path):
+    lib, thumbs = _library(tmp_path)
+    prefetcher, decoded = _prefetcher(thumbs)
+    prefetcher.cancel()
+    future = prefetcher._executor.submit(prefetcher._run_pass, str(lib / "a"), prefetcher._generation - 1)
+    future.result(timeout=5)
+    prefetcher.shutdown()
+    assert decoded == []
+
+
+def test_follow_up_lookups_do_not_count(tmp_path):
+    lib, thumbs = _library(tmp_path)
+    prefetcher, _ = _prefetcher(thumbs)
+    folder = str(lib / "a")
+
+    # One counted lookup per navigation, then the folder's own jobs reuse it
+    assert prefetcher.listing(folder, cached_only=True) is None
+    assert prefetcher.listing(folder, record=False) == [str(lib / "a" / "a.obj")]
+    prefetcher.listing(folder, record=False)
+
+    stats = prefetcher.stats()
+    prefetcher.shutdown()
+    assert stats["listing_hits"] == 0
+    assert stats["listing_misses"] == 1
+    assert stats["listing_hit_rate"] == 0.0
+
+
+def test_abandoned_listing_is_not_cached(tmp_path):
+    lib, thumbs = _library(tmp_path)
+    prefetcher, _ = _prefetcher(thumbs)
+    folder = str(lib / "a")
+
+    assert prefetcher.listing(folder, record=False, is_current=lambda: False) is None
+    assert prefetcher.listing(folder, cached_only=True) is None
+    assert prefetcher.listing(folder, record=False, is_current=lambda: True) == [str(lib / "a" / "a.obj")]
+    assert prefetcher.listing(folder, cached_only=True) == [str(lib / "a" / "a.obj")]
+    prefetcher.shutdown()
@@ -0,0 +1,138 @@
+# tests/test_render_server.py
+import time
+import threading
+
+import pytest
+
+from asset_nav_panel.render_server import RenderServer, RenderClient, FakeJobHandler
+
+
+def _start_server(handler, port=0, max_queue=16):
+    server = RenderServer(handler, port=port, max_queue=max_queue)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def _collect(client, count, timeout=10):
+    results = {}
+    deadline = time.time() + timeout
+    while len(results) < count and time.time() < deadline:
+        msg = client.results.get(timeout=timeout)
+        results[msg["id"]] = msg
+    return results
+
+
+def test_thumbnail_and_analyze_round_trip(tmp_path):
+    model = tmp_path / "model.obj"
+    model.write_text("v 0 0 0\n")
+    png = str(tmp_path / "thumb.png")
+
+    server = _start_server(FakeJobHandler())
+    client = RenderClient(port=server.port)
+    client.connect()
+    try:
+        thumb_id = client.submit("thumbnail", str(model), output=png, size=32)
+        analyze_id = client.submit("analyze", str(model))
+        missing_id = client.submit("analyze", str(tmp_path / "missing.obj"))
+        results = _collect(client, 3)
+    finally:
+        client.close()
+        server.stop()
+
+    assert results[thumb_id]["type"] == "result"
+    with open(png, "rb") as f:
+        assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+    assert results[analyze_id]["data"]["meshes"][0]["polygons"] == 6
+    assert results[missing_id]["type"] == "error"
+
+
+def test_client_only_sends_kinds_the_server_runs(tmp_path):
+    model = tmp_path / "model.obj"
+    model.write_text("v 0 0 0\n")
+
+    # Like a mayapy server: no model panel, so no turntables
+    handler = FakeJobHandler()
+    handler.kinds = ("thumbnail", "analyze")
+    server = _start_server(handler)
+    client = RenderClient(port=server.port)
+    client.connect()
+    try:
+        assert client.kinds == ("thumbnail", "analyze")
+        with pytest.raises(ValueError):
+            client.submit("turntable", str(model), output=str(tmp_path / "turn.avi"))
+        assert client.pending_count() == 0
+    finally:
+        client.close()
+        server.stop()
+
+
+def test_busy_server_jobs_are_resent(tmp_path):
+    model = tmp_path / "model.obj"
+    model.write_text("v 0 0 0\n")
+
+    # Queue of one with slow jobs forces "busy" answers
+    handler = FakeJobHandler(delay=0.05)
+    server = _start_server(handler, max_queue=1)
+    client = RenderClient(port=server.port, max_in_flight=6, reconnect_delay=0.02)
+    client.connect()
+    try:
+        ids = [client.submit("analyze", str(model)) for _ in range(6)]
+        results = _collect(client, 6)
+    finally:
+        client.close()
+        server.stop()
+
+    assert set(results) == set(ids)
+    assert all(r["type"] == "result" for r in results.values())
+
+
+def test_client_reconnects_and_resends_pending_jobs(tmp_path):
+    model = tmp_path / "model.obj"
+    model.write_text("v 0 0 0\n")
+
+    server = _start_server(FakeJobHandler(delay=0.5))
+    port = server.port
+    client = RenderClient(port=port, reconnect_delay=0.1)
+    client.connect()
+    try:
+        job_id = client.submit("analyze", str(model))
+        time.sleep(0.1)
+        server.stop()
+
+        server = _start_server(FakeJobHandler(), port=port)
+        results = _collect(client, 1)
+    finally:
+        client.close()
+        server.stop()
+
+    assert results[job_id]["type"] == "result"
+    assert client.pending_count() == 0
+
+
+def test_worker_recycles_when_memory_stays_over_limit(tmp_path):
+    model = tmp_path / "model.obj"
+    model.write_text("v 0 0 0\n")
+
+    handler = FakeJobHandler(memory_per_job=60)
+    server = RenderServer(handler, port=0, max_memory_mb=100)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client = RenderClient(port=server.port, max_reconnects=1, reconnect_delay=0.05)
+    client.connect()
+    try:
+        first = client.submit("analyze", str(model))
+        second = client.submit("analyze", str(model))
+        results = _collect(client, 2)
+        thread.join(timeout=5)
+    finally:
+        client.close()
+        server.stop()
+
+    assert results[first]["stats"]["memory_mb"] == 60
+    assert results[second]["type"] == "result"
+    assert server.recycle_requested
+    assert not thread.is_alive()
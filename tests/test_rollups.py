@@ -0,0 +1,84 @@
+# tests/test_rollups.py
+import os
+
+from asset_nav_panel.rollups import FolderRollups, ReportCache
+
+
+def _report(polys, ngons=0, errors=None):
+    return {
+        "model": "",
+        "meshes": [{"mesh": "m", "vertices": polys + 2, "polygons": polys, "ngons": ngons, "uv_sets": []}],
+        "errors": errors or [],
+    }
+
+
+def test_totals_roll_up_the_ancestor_chain():
+    root = os.path.join(os.sep, "lib")
+    rollups = FolderRollups()
+    rollups.update_asset(os.path.join(root, "chars", "hero.obj"), _report(100, ngons=2))
+    rollups.update_asset(os.path.join(root, "chars", "villain.obj"), _report(50))
+    rollups.update_asset(os.path.join(root, "props", "box.obj"), _report(6, errors=["bad uv"]))
+
+    assert rollups.totals(os.path.join(root, "chars"))["polygons"] == 150
+    lib = rollups.totals(root)
+    assert lib["files"] == 3
+    assert lib["polygons"] == 156
+    assert lib["ngons"] == 2
+    assert lib["broken"] == 1
+
+
+def test_update_and_remove_only_adjust_ancestors():
+    root = os.path.join(os.sep, "lib")
+    hero = os.path.join(root, "chars", "hero.obj")
+    box = os.path.join(root, "props", "box.obj")
+    rollups = FolderRollups()
+    rollups.update_asset(hero, _report(100))
+    rollups.update_asset(box, _report(6))
+
+    rollups.update_asset(hero, _report(40))
+    assert rollups.totals(root)["polygons"] == 46
+    assert rollups.totals(os.path.join(root, "props"))["polygons"] == 6
+
+    rollups.remove_asset(hero)
+    assert rollups.totals(os.path.join(root, "chars"))["files"] == 0
+    assert rollups.totals(root)["files"] == 1
+
+
+def test_report_cache_detects_changed_files(tmp_path):
+    model = tmp_path / "hero.obj"
+    model.write_text("v 0 0 0\n")
+    cache = ReportCache(str(tmp_path / "reports.json"))
+    cache.put(str(model), _report(10))
+    cache.save()
+
+    loaded = ReportCache(str(tmp_path / "reports.json"))
+    loaded.load()
+    rollups = FolderRollups()
+    loaded.fill(rollups)
+    assert rollups.totals(str(tmp_path))["polygons"] == 10
+
+    model.write_text("v 0 0 0\nv 1 1 1\n")
+    stale = loaded.stale_in(str(tmp_path))
+    assert stale == [os.path.normpath(str(model))]
+    assert loaded.get(str(model)) is None
+
+
+def test_fill_trusts_the_cache_and_stale_in_checks_every_folder(tmp_path):
+    (tmp_path / "chars").mkdir()
+    hero = tmp_path / "chars" / "hero.obj"
+    box = tmp_path / "box.obj"
+    for model in (hero, box):
+        model.write_text("v 0 0 0\n")
+    cache = ReportCache(str(tmp_path / "reports.json"))
+    cache.put(str(hero), _report(10))
+    cache.put(str(box), _report(6))
+
+    # fill() does not stat, a deleted asset stays until stale_in() runs
+    hero.unlink()
+    rollups = FolderRollups()
+    cache.fill(rollups)
+    assert rollups.totals(str(tmp_path))["polygons"] == 16
+
+    assert cache.stale_in() == [os.path.normpath(str(hero))]
+    assert cache.stale_in() == []
+    assert cache.get(str(box))["meshes"][0]["polygons"] == 6
@@ -0,0 +1,141 @@
+# tests/test_sniff.py
+import struct
+
+from asset_nav_panel.sniff import sniff_metadata, sniff_many, FBX_BINARY_MAGIC
+
+MAYA_ASCII = """//Maya ASCII 2022 scene
+//Name: hero.ma
+requires maya "2022";
+requires -nodeType "aiOptions" -dataType "aiAOV" "mtoa" "5.0.0";
+requires "stereoCamera" "10.0";
+currentUnit -l centimeter -a degree -t film;
+createNode transform -n "hero";
+createNode mesh -n "heroShape" -p "hero";
+createNode transform -n "prop";
+createNode mesh -n "propShape" -p "prop";
+"""
+
+USDA = """#usda 1.0
+(
+    defaultPrim = "root"
+    upAxis = "Z"
+)
+
+def Xform "root"
+{
+    def Mesh "body"
+    {
+    }
+    def Mesh "head"
+    {
+    }
+    over "material"
+    {
+    }
+}
+"""
+
+
+def _fbx_string(value):
+    data = value.encode("utf-8")
+    return b"S" + struct.pack("<I", len(data)) + data
+
+
+def test_maya_ascii_header(tmp_path):
+    path = tmp_path / "hero.ma"
+    path.write_text(MAYA_ASCII)
+    meta = sniff_metadata(str(path))
+
+    assert meta["maya_version"] == "2022"
+    assert meta["plugins"] == ["mtoa", "stereoCamera"]
+    assert meta["mesh_count"] == 2
+    assert meta["node_types"] == {"transform": 2, "mesh": 2}
+    assert not meta["truncated"]
+
+
+def test_maya_ascii_wrapped_statements(tmp_path):
+    path = tmp_path / "wrapped.ma"
+    path.write_text(
+        "//Maya ASCII 2023 scene\n"
+        "requires -nodeType \"aiOptions\" -nodeType \"aiAOVDriver\" -nodeType \"aiAOVFilter\"\n"
+        "\t\t -nodeType \"aiImagerDenoiserOidn\" \"mtoa\" \"5.2.1\";\n"
+        "requires \"stereoCamera\" \"10.0\";\n"
+        "createNode mesh -n \"heroShape\"\n"
+        "\t\t -p \"hero\";\n"
+    )
+    meta = sniff_metadata(str(path))
+
+    assert meta["plugins"] == ["mtoa", "stereoCamera"]
+    assert meta["mesh_count"] == 1
+
+
+def test_read_size_is_capped(tmp_path):
+    path = tmp_path / "hero.ma"
+    path.write_text(MAYA_ASCII)
+    meta = sniff_metadata(str(path), max_bytes=200)
+
+    assert meta["truncated"]
+    assert meta["mesh_count"] < 2
+
+
+def test_usda_prims_and_up_axis(tmp_path):
+    path = tmp_path / "hero.usd"
+    path.write_text(USDA)
+    meta = sniff_metadata(str(path))
+
+    assert meta["format"] == "usda"
+    assert meta["up_axis"] == "z"
+    assert meta["mesh_count"] == 2
+    assert meta["node_types"] == {"Xform": 1, "Mesh": 2, "over": 1}
+
+
+def test_binary_fbx_header(tmp_path):
+    data = FBX_BINARY_MAGIC + b"\x1a\x00" + struct.pack("<I", 7400)
+    data += _fbx_string("UpAxis") + _fbx_string("int") + _fbx_string("Integer") + _fbx_string("")
+    data += b"I" + struct.pack("<i", 2)
+    data += _fbx_string("LastSaved|ApplicationName") + _fbx_string("KString") + _fbx_string("") + _fbx_string("")
+    data += _fbx_string("Maya")
+    data += _fbx_string("LastSaved|ApplicationVersion") + _fbx_string("KString") + _fbx_string("") + _fbx_string("")
+    data += _fbx_string("2023")
+    for name in ("body", "head"):
+        data += _fbx_string(name + "\x00\x01Geometry") + _fbx_string("Mesh")
+    path = tmp_path / "hero.fbx"
+    path.write_bytes(data)
+
+    meta = sniff_metadata(str(path))
+    assert meta["fbx_version"] == 7400
+    assert meta["up_axis"] == "z"
+    assert meta["maya_version"] == "2023"
+    assert meta["mesh_count"] == 2
+
+
+def test_sniff_many_skips_unknown_formats(tmp_path):
+    obj = tmp_path / "box.obj"
+    obj.write_text("o box\nv 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n")
+    other = tmp_path / "notes.txt"
+    other.write_text("hello")
+
+    result = sniff_many([str(obj), str(other)])
+    assert result[str(obj)]["vertices"] == 3
+    assert result[str(obj)]["mesh_count"] == 1
+    assert result[str(other)] is None
+
+
+def test_single_long_line_does_not_break_the_read_cap(tmp_path):
+    import tracemalloc
+
+    # USDA writes whole point arrays on one line
+    path = tmp_path / "big.usda"
+    with open(str(path), "w") as f:
+        f.write('#usda 1.0\ndef Mesh "body"\n{\n    point3f[] points = [')
+        f.write("(0, 0, 0), " * (1024 * 1024))
+        f.write("]\n}\n")
+
+    tracemalloc.start()
+    meta = sniff_metadata(str(path), max_bytes=64 * 1024)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert meta["truncated"]
+    assert meta["mesh_count"] == 1
+    assert peak < 1024 * 1024
@@ -0,0 +1,92 @@
+# tests/test_softrender.py
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from asset_nav_panel.softrender import load_obj, normalize, rasterize, render_obj_thumbnails, BACKGROUND
+
+CUBE = """v -1 -1 -1
+v 1 -1 -1
+v 1 1 -1
+v -1 1 -1
+v -1 -1 1
+v 1 -1 1
+v 1 1 1
+v -1 1 1
+f 1 2 3 4
+f 5 8 7 6
+f 1 5 6 2
+f 2 6 7 3
+f 3 7 8 4
+f -8 -4 -1 -5
+"""
+
+
+def test_load_obj_triangulates_quads_and_negative_indices(tmp_path):
+    path = tmp_path / "cube.obj"
+    path.write_text(CUBE)
+    vertices, triangles = load_obj(str(path))
+
+    assert vertices.shape == (8, 3)
+    assert triangles.shape == (12, 3)
+    assert triangles.min() == 0 and triangles.max() == 7
+
+
+def test_normalize_fits_unit_box():
+    vertices = np.array([[10.0, 0.0, 0.0], [14.0, 2.0, 1.0]])
+    result = normalize(vertices)
+    assert np.allclose(result.min(axis=0) + result.max(axis=0), 0)
+    assert np.isclose((result.max(axis=0) - result.min(axis=0)).max(), 1.0)
+
+
+def test_rasterize_covers_center_and_keeps_background(tmp_path):
+    path = tmp_path / "cube.obj"
+    path.write_text(CUBE)
+    vertices, triangles = load_obj(str(path))
+    image = rasterize(vertices, triangles, size=64)
+
+    assert image.shape == (64, 64, 3)
+    assert tuple(image[0, 0]) == BACKGROUND
+    assert tuple(image[32, 32]) != BACKGROUND
+
+
+def test_render_obj_thumbnails_in_process_pool(tmp_path):
+    good = tmp_path / "cube.obj"
+    good.write_text(CUBE)
+    empty = tmp_path / "empty.obj"
+    empty.write_text("# nothing\n")
+    jobs = [(str(good), str(tmp_path / "cube")), (str(empty), str(tmp_path / "empty"))]
+
+    results = render_obj_thumbnails(jobs, max_workers=2, size=32)
+
+    assert results[str(good)] is None
+    assert "No geometry" in results[str(empty)]
+    with open(str(tmp_path / "cube"), "rb") as f:
+        assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+def test_small_batches_render_the_same_image(tmp_path, monkeypatch):
+    import asset_nav_panel.softrender as softrender
+
+    path = tmp_path / "cube.obj"
+    path.write_text(CUBE)
+    vertices, triangles = load_obj(str(path))
+    expected = rasterize(vertices, triangles, size=32, shading="normal")
+
+    # One triangle per batch in every size bucket
+    monkeypatch.setattr(softrender, "MAX_BATCH_SAMPLES", 1)
+    assert np.array_equal(rasterize(vertices, triangles, size=32, shading="normal"), expected)
+
+
+def test_cli_names_thumbnails_by_absolute_path(tmp_path, monkeypatch):
+    import os
+    from asset_nav_panel.softrender import main
+    from asset_nav_panel.utils import flat_thumbnail_name
+
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "cube.obj").write_text(CUBE)
+    monkeypatch.chdir(tmp_path)
+
+    assert main(["models", "out", "--size", "16", "--workers", "1"]) == 0
+    expected = flat_thumbnail_name(os.path.abspath(os.path.join("models", "cube.obj")))
+    assert os.listdir("out") == [expected]
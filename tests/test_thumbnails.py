@@ -0,0 +1,150 @@
+# tests/test_thumbnails.py
+import sys
+import types
+import importlib
+
+import pytest
+
+
+class FakeCmds(types.ModuleType):
+    """
+    Scene of two meshes for import_for_preview, recording every call.
+    """
+    def __init__(self, polygons=(600, 400), import_error=None):
+        super().__init__("maya.cmds")
+        self.polygons = dict(zip(("|body", "|head"), polygons))
+        self.import_error = import_error
+        self.undo_state = True
+        self.calls = []
+
+    def file(self, *args, **flags):
+        self.calls.append(("file", args, flags))
+        if flags.get("i") and self.import_error:
+            raise RuntimeError(self.import_error)
+
+    def pluginInfo(self, plugin, q=True, loaded=True):
+        return True
+
+    def loadPlugin(self, plugin, quiet=True):
+        pass
+
+    def undoInfo(self, q=False, state=False, stateWithoutFlush=None):
+        if q:
+            return self.undo_state
+        self.calls.append(("undoInfo", stateWithoutFlush))
+        self.undo_state = stateWithoutFlush
+
+    def ls(self, type=None, noIntermediate=True, long=True):
+        return [t + "|" + t[1:] + "Shape" for t in self.polygons]
+
+    def listRelatives(self, shapes, parent=True, fullPath=True):
+        return [s.rsplit("|", 1)[0] for s in shapes]
+
+    def polyEvaluate(self, transform, face=True):
+        return self.polygons[transform]
+
+    def polyCube(self, name=None):
+        self.calls.append(("polyCube", name))
+
+    def geomToBBox(self, transforms, keepOriginal=False):
+        self.calls.append(("geomToBBox", list(transforms)))
+
+    def polyReduce(self, transform, percentage=0, replaceOriginal=True, constructionHistory=False):
+        self.calls.append(("polyReduce", transform, round(percentage, 3)))
+
+    def flushUndo(self):
+        self.calls.append(("flushUndo",))
+
+    def clearCache(self, all=True):
+        raise RuntimeError("clearCache is not available in this session")
+
+
+@pytest.fixture
+def thumbnails(monkeypatch):
+    def load(**kwargs):
+        cmds = FakeCmds(**kwargs)
+        maya = types.ModuleType("maya")
+        maya.cmds = cmds
+        monkeypatch.setitem(sys.modules, "maya", maya)
+        monkeypatch.setitem(sys.modules, "maya.cmds", cmds)
+        module = importlib.import_module("asset_nav_panel.thumbnails")
+        monkeypatch.setattr(module, "cmds", cmds)
+        return module, cmds
+    return load
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "hero.obj"
+    path.write_bytes(b"x" * 2048)
+    return str(path)
+
+
+def _imported(cmds):
+    return [c for c in cmds.calls if c[0] == "file" and c[2].get("i")]
+
+
+def test_unknown_policy_is_rejected(thumbnails):
+    module, _ = thumbnails()
+    with pytest.raises(ValueError):
+        module.ImportBudget(policy="shrink")
+
+
+def test_oversized_file_is_skipped_before_import(thumbnails, model):
+    module, cmds = thumbnails()
+    budget = module.ImportBudget(max_file_mb=0.001, policy="skip")
+    with pytest.raises(module.AssetTooLargeError):
+        module.import_for_preview(model, budget)
+    assert _imported(cmds) == []
+
+
+@pytest.mark.parametrize("policy", ["proxy", "decimate"])
+def test_oversized_file_gets_a_placeholder(thumbnails, model, policy):
+    module, cmds = thumbnails()
+    info = module.import_for_preview(model, module.ImportBudget(max_file_mb=0.001, policy=policy))
+    assert info == {"mode": "placeholder", "polygons": None}
+    assert ("polyCube", "oversized_placeholder") in cmds.calls
+    assert _imported(cmds) == []
+
+
+def test_within_budget_imports_everything(thumbnails, model):
+    module, cmds = thumbnails()
+    info = module.import_for_preview(model, module.ImportBudget(max_polygons=1000))
+    assert info == {"mode": "full", "polygons": 1000}
+    assert len(_imported(cmds)) == 1
+    assert not [c for c in cmds.calls if c[0] in ("geomToBBox", "polyReduce")]
+
+
+def test_polygon_budget_skip(thumbnails, model):
+    module, _ = thumbnails()
+    with pytest.raises(module.AssetTooLargeError):
+        module.import_for_preview(model, module.ImportBudget(max_polygons=500, policy="skip"))
+
+
+def test_polygon_budget_proxy_replaces_every_mesh(thumbnails, model):
+    module, cmds = thumbnails()
+    info = module.import_for_preview(model, module.ImportBudget(max_polygons=500, policy="proxy"))
+    assert info == {"mode": "proxy", "polygons": 1000}
+    assert ("geomToBBox", ["|body", "|head"]) in cmds.calls
+
+
+def test_polygon_budget_decimate_reduces_to_the_budget(thumbnails, model):
+    module, cmds = thumbnails()
+    info = module.import_for_preview(model, module.ImportBudget(max_polygons=250, policy="decimate"))
+    assert info == {"mode": "decimated", "polygons": 1000}
+    assert [c for c in cmds.calls if c[0] == "polyReduce"] == [
+        ("polyReduce", "|body", 75.0), ("polyReduce", "|head", 75.0)]
+
+
+def test_undo_state_is_restored_when_the_import_fails(thumbnails, model):
+    module, cmds = thumbnails(import_error="Corrupt file")
+    with pytest.raises(RuntimeError):
+        module.import_for_preview(model)
+    assert [c[1] for c in cmds.calls if c[0] == "undoInfo"] == [False, True]
+    assert cmds.undo_state is True
+
+
+def test_release_scene_memory_survives_missing_clear_cache(thumbnails):
+    module, cmds = thumbnails()
+    module.release_scene_memory()
+    assert cmds.calls == [("file", (), {"new": True, "force": True}), ("flushUndo",)]